@@ -12,10 +12,10 @@ Modules:
 """
 
 from .utils import (
+    Voter,
     profile_preprocessing,
     cardinal_utility,
     cost_utility,
-    filter_sd,
     calculate_bang_per_buck,
 )
 
@@ -23,6 +23,7 @@ from .ees import (
     exact_method_of_equal_shares,
     exact_method_of_equal_shares_approval,
     exact_method_of_equal_shares_cost,
+    prepare_ees_setup,
 )
 
 from .add_opt import (
@@ -37,6 +38,7 @@ from .add_opt import (
 from .cli import (
     run_experiment,
     save_results,
+    save_results_dict,
     setup_results_dir,
 )
 
@@ -46,19 +48,21 @@ from .mes import (
     calculate_efficiency,
     mes_with_budget_increase_exhaustion,
     create_mes_results_df,
+    create_mes_results_row,
 )
 
 __all__ = [
     # utils
+    "Voter",
     "profile_preprocessing",
     "cardinal_utility",
     "cost_utility",
-    "filter_sd",
     "calculate_bang_per_buck",
     # ees
     "exact_method_of_equal_shares",
     "exact_method_of_equal_shares_approval",
     "exact_method_of_equal_shares_cost",
+    "prepare_ees_setup",
     # add_opt
     "greedy_project_change_approvals",
     "greedy_project_change_uniform",
@@ -69,6 +73,7 @@ __all__ = [
     # cli
     "run_experiment",
     "save_results",
+    "save_results_dict",
     "setup_results_dir",
     # mes
     "run_mes_approval",
@@ -76,5 +81,6 @@ __all__ = [
     "calculate_efficiency",
     "mes_with_budget_increase_exhaustion",
     "create_mes_results_df",
+    "create_mes_results_row",
 ]
 
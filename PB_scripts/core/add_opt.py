@@ -5,18 +5,73 @@ This module contains the algorithms for computing the minimum budget increase
 needed to change the EES outcome, for both cardinal (approval) and uniform (cost) utilities.
 """
 
-from typing import Callable, Dict, List, Set, Tuple, Any
-import copy
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+
+import numpy as np
+
+from .utils import (
+    profile_preprocessing,
+    cost_utility,
+    cardinal_utility,
+    build_payments_matrix,
+    build_shares_array,
+    equal_share,
+    as_float_array,
+    build_approval_matrix,
+    compute_payer_counts,
+    njit,
+)
+
+
+def _own_payments(payments_matrix: np.ndarray, selected_projects: List, project) -> np.ndarray:
+    """
+    Column of payments towards project (all zeros unless it is selected).
+    """
+    if project in selected_projects:
+        return payments_matrix[:, selected_projects.index(project)]
+    return np.zeros(len(payments_matrix), dtype=object)
+
 
-from .utils import profile_preprocessing, cost_utility, cardinal_utility
+def _profile_supports(profile: List, project) -> np.ndarray:
+    """
+    Boolean approval mask of project over profile rows, read from the ballots.
+    """
+    return np.array([project in voter.approved for voter in profile], dtype=bool)
+
+
+def _payment_summary(initial_budget, payments_matrix: np.ndarray) -> Tuple:
+    """
+    Per-voter leftover budget, largest payment and the column it goes to.
+    
+    None of these depend on the project being changed, so ADD-OPT computes
+    them in a single pass over the payment matrix and every
+    greedy_project_change_approvals call just gathers its supporters' rows.
+    
+    Returns:
+        Tuple of (leftover_budgets, max_pay_columns, max_pay_amounts), each
+        indexed by profile row
+    """
+    num_voters, num_selected = payments_matrix.shape
+    leftover_budgets = equal_share(initial_budget, num_voters) - payments_matrix.sum(axis=1)
+    if num_selected == 0:
+        return leftover_budgets, np.zeros(num_voters, dtype=np.intp), np.zeros(num_voters, dtype=object)
+    max_pay_columns = payments_matrix.argmax(axis=1)
+    max_pay_amounts = payments_matrix[np.arange(num_voters), max_pay_columns]
+    return leftover_budgets, max_pay_columns, max_pay_amounts
 
 
 def greedy_project_change_approvals(
     instance,
     profile,
     selected_projects: List,
-    payments: Dict,
-    project
+    payments_matrix: np.ndarray,
+    project,
+    supports: np.ndarray = None,
+    payment_summary: Tuple = None,
+    num_paying_supporters: int = None
 ) -> float:
     """
     Compute the minimum budget increase for a project to certify instability (cardinal utilities).
@@ -27,115 +82,146 @@ def greedy_project_change_approvals(
         instance: Pabulib instance
         profile: Preprocessed voter profile
         selected_projects: Currently selected projects
-        payments: Current payment allocations
+        payments_matrix: Dense payment matrix of shape (num_voters, len(selected_projects)),
+            see build_payments_matrix
         project: Project to consider for change
+        supports: Boolean supporter mask of project over profile rows, i.e. its
+            column of the approval matrix (computed from the profile if omitted)
+        payment_summary: Per-voter payment data from _payment_summary
+            (computed from payments_matrix if omitted)
+        num_paying_supporters: Number of supporters paying for project, see
+            compute_payer_counts (counted from payments_matrix if omitted)
         
     Returns:
         Minimum budget increase d, or infinity if project cannot certify instability
     """
-    num_voters = len(profile)
     project_cost = project.cost
-    initial_budget = instance.budget_limit
-    profile = profile_preprocessing(profile)
 
-    # Identify supporters of the project
-    supporters = [voter['name'] for voter in profile if project in voter['approved']]
-    supporters_not_paying = [
-        voter for voter in supporters 
-        if payments.get((voter, project), 0) == 0
-    ]
+    # Payments towards the project itself (only non-zero if it is already selected)
+    own_payments = _own_payments(payments_matrix, selected_projects, project)
 
-    if not supporters_not_paying:
-        return float("inf")
+    # Identify supporters of the project (as row indices into payments_matrix)
+    if supports is None:
+        supports = _profile_supports(profile, project)
+    supporters = np.flatnonzero(supports)
+    supporter_payments = own_payments[supporters]
+    supporters_not_paying = supporters[supporter_payments == 0]
+    if num_paying_supporters is None:
+        num_paying_supporters = int(np.count_nonzero(supporter_payments > 0))
 
-    # Compute leftover budgets for supporters not paying
-    leftover_budgets = {
-        voter: ((initial_budget / num_voters)
-                - sum(payments.get((voter, p), 0) for p in selected_projects))
-        for voter in supporters_not_paying
-    }
+    if len(supporters_not_paying) == 0:
+        return float("inf")
 
-    # Compute max payment each supporter is making (project, payment)
-    max_payments = {
-        voter: max(
-            ((p, payments.get((voter, p), 0)) for p in selected_projects),
-            key=lambda x: x[1],
-            default=(None, 0)
+    # Everything below is indexed by position within supporters_not_paying
+    num_candidates = len(supporters_not_paying)
+    if payment_summary is None:
+        payment_summary = _payment_summary(instance.budget_limit, payments_matrix)
+    leftover_budgets, max_pay_columns, max_pay_amounts = (
+        values[supporters_not_paying] for values in payment_summary
+    )
+
+    # The project each supporter pays most for is only needed for
+    # tie-breaking against `project`, so it is encoded as the sign of the
+    # name comparison (0 when there is none).
+    if selected_projects:
+        name_cmp = np.array(
+            [(p.name > project.name) - (p.name < project.name) for p in selected_projects],
+            dtype=np.int8
         )
-        for voter in supporters_not_paying
-    }
+        max_pay_name_cmp = name_cmp[max_pay_columns]
+        project_rank = np.empty(len(selected_projects), dtype=np.intp)
+        project_rank[sorted(range(len(selected_projects)), key=lambda k: selected_projects[k])] = (
+            np.arange(len(selected_projects))
+        )
+        max_pay_rank = project_rank[max_pay_columns]
+    else:
+        max_pay_name_cmp = np.zeros(num_candidates, dtype=np.int8)
+        max_pay_rank = np.zeros(num_candidates, dtype=np.intp)
 
     # Sort supporters by leftover budgets and max payments
-    sorted_leftovers = sorted(leftover_budgets.items(), key=lambda x: x[1])
-    sorted_max_payments = sorted(max_payments.items(), key=lambda x: (x[1][1], x[1][0]))
-
-    min_increase = float("inf")
-    solvent: Set = set()  # Voters who would deviate from current projects
-    liquid: Set = set(supporters_not_paying)  # Voters willing to allocate leftover budget
+    sorted_leftovers = np.argsort(leftover_budgets, kind="stable")
+    sorted_max_payments = np.lexsort((max_pay_rank, max_pay_amounts))
+
+    # Use the compiled kernel when the amounts are plain floats; exact
+    # rationals (the pabutools default) stay on the Python path.
+    leftover_floats = as_float_array(leftover_budgets)
+    max_pay_floats = as_float_array(max_pay_amounts)
+    if leftover_floats is not None and max_pay_floats is not None:
+        return _greedy_inner(
+            sorted_leftovers, leftover_floats, sorted_max_payments, max_pay_floats,
+            max_pay_name_cmp, float(project_cost), num_paying_supporters
+        )
+    return _greedy_inner.py_func(
+        sorted_leftovers, leftover_budgets, sorted_max_payments, max_pay_amounts,
+        max_pay_name_cmp, project_cost, num_paying_supporters
+    )
+
+
+@njit(cache=True)
+def _greedy_inner(
+    sorted_leftovers,
+    leftover_budgets,
+    sorted_max_payments,
+    max_pay_amounts,
+    max_pay_name_cmp,
+    project_cost,
+    num_paying_supporters
+):
+    """
+    Main loop of greedy_project_change_approvals over array inputs.
     
+    Voters are positions into the per-supporter arrays; a voter is either
+    liquid, solvent or removed, tracked with boolean masks.
+    """
+    num_candidates = len(sorted_leftovers)
+    liquid = np.ones(num_candidates, dtype=np.bool_)  # Voters willing to allocate leftover budget
+    solvent = np.zeros(num_candidates, dtype=np.bool_)  # Voters who would deviate from current projects
+    num_liquid = num_candidates
+    num_solvent = 0
+
+    min_increase = np.inf
     i, j = 0, 0
     
-    while liquid or solvent:
-        if i >= len(sorted_leftovers):
+    while num_liquid > 0 or num_solvent > 0:
+        if i >= num_candidates:
             break
 
         # Calculate per-voter price
-        total_voters = (
-            len(liquid) + len(solvent) +
-            len([voter for voter in supporters if payments.get((voter, project), 0) > 0])
-        )
+        total_voters = num_liquid + num_solvent + num_paying_supporters
         
         if total_voters == 0:
             break
             
         pvp = project_cost / total_voters
 
-        # Check if current max payment is less than pvp (deviant case)
-        if j < len(sorted_max_payments):
-            max_pay_amount = sorted_max_payments[j][1][1]
-            max_pay_project = sorted_max_payments[j][1][0]
+        # Check if current max payment is less than pvp (deviant case); once
+        # every voter has been checked, j stays at num_candidates
+        if j < num_candidates:
+            max_pay_voter = sorted_max_payments[j]
+            max_pay_amount = max_pay_amounts[max_pay_voter]
             
-            if max_pay_amount < pvp or (max_pay_amount == pvp and max_pay_project is not None and max_pay_project.name > project.name):
-                solvent.discard(sorted_max_payments[j][0])
+            if max_pay_amount < pvp or (max_pay_amount == pvp and max_pay_name_cmp[max_pay_voter] > 0):
+                if solvent[max_pay_voter]:
+                    solvent[max_pay_voter] = False
+                    num_solvent -= 1
                 j += 1
                 continue
+
+        # Next voter by leftover budget leaves the liquid set: either moving
+        # to solvent or bounding the required budget increment
+        current_voter = sorted_leftovers[i]
+        if liquid[current_voter]:
+            voter_max_pay = max_pay_amounts[current_voter]
             
-            # Check if voter should move from liquid to solvent
-            current_voter = sorted_leftovers[i][0]
-            if current_voter in liquid:
-                voter_max_pay = max_payments[current_voter][1]
-                voter_max_proj = max_payments[current_voter][0]
-                
-                if voter_max_pay > pvp or (voter_max_pay == pvp and voter_max_proj is not None and voter_max_proj.name < project.name):
-                    solvent.add(current_voter)
-                    liquid.remove(current_voter)
-                    i += 1
-                    continue
-                else:
-                    # Calculate required budget increment
-                    required_increase = pvp - sorted_leftovers[i][1]
-                    min_increase = min(min_increase, required_increase)
-                    liquid.remove(current_voter)
-                    i += 1
-                    continue
-        
-        # Handle case when j >= len(sorted_max_payments)
-        current_voter = sorted_leftovers[i][0]
-        if current_voter in liquid:
-            voter_max_pay = max_payments[current_voter][1]
-            voter_max_proj = max_payments[current_voter][0]
-            
-            if voter_max_pay > pvp or (voter_max_pay == pvp and voter_max_proj is not None and voter_max_proj.name < project.name):
-                solvent.add(current_voter)
-                liquid.remove(current_voter)
-                i += 1
+            if voter_max_pay > pvp or (voter_max_pay == pvp and max_pay_name_cmp[current_voter] < 0):
+                solvent[current_voter] = True
+                num_solvent += 1
             else:
-                required_increase = pvp - sorted_leftovers[i][1]
+                required_increase = pvp - leftover_budgets[current_voter]
                 min_increase = min(min_increase, required_increase)
-                liquid.remove(current_voter)
-                i += 1
-        else:
-            i += 1
+            liquid[current_voter] = False
+            num_liquid -= 1
+        i += 1
 
     return min_increase
 
@@ -144,10 +230,12 @@ def greedy_project_change_uniform(
     instance,
     profile,
     selected_projects_with_bpb: List[Tuple],
-    payments: Dict,
+    payments_matrix: np.ndarray,
     project,
-    L: List[List],
-    utility_function: Callable = cost_utility
+    L: np.ndarray,
+    utility_function: Callable = cost_utility,
+    N_p: int = None,
+    O_p_X: np.ndarray = None
 ) -> float:
     """
     Compute the minimum budget increase for a project to certify instability (uniform utilities).
@@ -158,10 +246,14 @@ def greedy_project_change_uniform(
         instance: Pabulib instance
         profile: Preprocessed voter profile
         selected_projects_with_bpb: List of (project, bpb) tuples in selection order
-        payments: Current payment allocations
+        payments_matrix: Dense payment matrix of shape (num_voters, len(selected_projects_with_bpb)),
+            see build_payments_matrix
         project: Project to consider
-        L: Pre-computed L lists for budget aggregation
+        L: Pre-computed sorted L values restricted to O_p(X) (see _get_L_Op)
         utility_function: Utility function (default: cost_utility)
+        N_p: Number of supporters of project (computed from the profile if omitted)
+        O_p_X: Profile rows of the supporters not paying for project
+            (computed from the profile if omitted)
         
     Returns:
         Minimum budget increase d, or infinity if project cannot certify instability
@@ -170,27 +262,32 @@ def greedy_project_change_uniform(
     d = float("inf")
     ell = 0
     i = len(selected_projects_with_bpb)
-    N_p = sum(1 for voter in voter_list if project in voter['approved'])
-
-    # Calculate O_p(X): supporters not currently paying
-    O_p_X = [
-        voter['name']
-        for voter in voter_list
-        if project in voter['approved'] and payments.get((voter['name'], project), 0) == 0
-    ]
+    if N_p is None or O_p_X is None:
+        supports = _profile_supports(voter_list, project)
+        N_p = int(np.count_nonzero(supports))
+
+        # Calculate O_p(X): supporters not currently paying
+        selected_projects = [p for p, _ in selected_projects_with_bpb]
+        own_payments = _own_payments(payments_matrix, selected_projects, project)
+        O_p_X = np.flatnonzero(supports & (own_payments == 0))
+
+    # Per-voter price and bang-per-buck once ell voters of O_p(X) have been
+    # added; O_p(X) only holds supporters, so N_p - ell is always positive
+    PvP_arr = project.cost / (N_p - np.arange(len(O_p_X), dtype=object))
+    if project.cost > 0:
+        bpb_arr = utility_function(project) / PvP_arr
+    else:
+        # A free project has price 0; its bang-per-buck counts as 0
+        bpb_arr = np.zeros(len(O_p_X), dtype=object)
 
     while i > 0 and ell < len(O_p_X):
-        remaining_buyers = N_p - ell
-        if N_p == 0:
-            PvP = float("inf")
-        else:
-            PvP = project.cost / (N_p - ell)
+        PvP = PvP_arr[ell]
+        current_bpb = bpb_arr[ell]
 
         # Check priority ordering
         while i > 0:
             prev_bpb = selected_projects_with_bpb[i - 1][1]
             prev_name = selected_projects_with_bpb[i - 1][0].name
-            current_bpb = utility_function(project) / PvP if PvP > 0 else 0
             
             if current_bpb < prev_bpb or (current_bpb == prev_bpb and prev_name < project.name):
                 i -= 1
@@ -198,20 +295,51 @@ def greedy_project_change_uniform(
                 break
 
         if i > 0 and ell < len(L[i]):
-            L_val = L[i][ell]
-            d = min(d, PvP - L_val[1])
+            d = min(d, PvP - L[i][ell])
         
         ell += 1
 
     return d
 
 
+def _map_over_projects(
+    func: Callable,
+    shared_args: Tuple,
+    per_project_args: List[Tuple],
+    n_jobs: Optional[int] = 1
+) -> List:
+    """
+    Evaluate func(*shared_args, *args) for every tuple in per_project_args.
+    
+    The calls are independent, so with n_jobs > 1 they are spread over a
+    process pool (n_jobs=-1 uses all cores; None, 0 and 1 run serially).
+    shared_args are then pickled once per chunk of projects rather than once
+    per project.
+    
+    Returns:
+        List of results in the order of per_project_args
+    """
+    if n_jobs is not None and n_jobs < -1:
+        raise ValueError(f"n_jobs must be -1 (all cores) or at least 0, got {n_jobs}")
+    if n_jobs in (None, 0, 1) or len(per_project_args) < 2:
+        return [func(*shared_args, *args) for args in per_project_args]
+
+    max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+    chunksize = -(-len(per_project_args) // max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            partial(func, *shared_args), *zip(*per_project_args), chunksize=chunksize
+        ))
+
+
 def add_opt_approval(
     instance,
     profile,
     selected_projects: List,
     payments: Dict,
-    shares: Dict
+    shares: Dict,
+    n_jobs: Optional[int] = 1,
+    budget: float = 0
 ) -> float:
     """
     Compute minimum budget increase for outcome instability (cardinal utilities).
@@ -224,18 +352,28 @@ def add_opt_approval(
         selected_projects: Currently selected projects
         payments: Payment allocations
         shares: Remaining voter budgets
+        n_jobs: Number of worker processes for the per-project loop (-1 for all
+            cores; None, 0 or 1 runs it in-process)
+        budget: Budget the outcome was computed with (uses instance.budget_limit if 0)
         
     Returns:
         Minimum d > 0 such that outcome becomes unstable
     """
     profile = profile_preprocessing(profile)
     projects = instance.project_meta
+    payments_matrix = build_payments_matrix(profile, selected_projects, payments)
+    approval_masks = _approval_masks(profile, projects)
+    payment_summary = _payment_summary(budget or instance.budget_limit, payments_matrix)
+    payer_counts = compute_payer_counts(payments_matrix, selected_projects)
     d = float("inf")
 
-    for p in projects:
-        gp = greedy_project_change_approvals(
-            instance, profile, selected_projects, payments, p
-        )
+    results = _map_over_projects(
+        greedy_project_change_approvals,
+        (instance, profile, selected_projects, payments_matrix),
+        [(p, approval_masks[p], payment_summary, payer_counts.get(p, 0)) for p in projects],
+        n_jobs
+    )
+    for gp in results:
         if gp > 0:
             d = min(d, gp)
 
@@ -247,23 +385,31 @@ def add_opt_approval_heuristic(
     profile,
     selected_projects: List,
     payments: Dict,
-    shares: Dict
+    shares: Dict,
+    n_jobs: Optional[int] = 1,
+    budget: float = 0
 ) -> float:
     """
     ADD-OPT heuristic: only consider unselected projects (cardinal utilities).
     
     This is the ADD-OPT-SKIP variant that skips already-selected projects.
+    See add_opt_approval for n_jobs and budget.
     """
     profile = profile_preprocessing(profile)
     projects = instance.project_meta
+    payments_matrix = build_payments_matrix(profile, selected_projects, payments)
+    approval_masks = _approval_masks(profile, projects)
+    payment_summary = _payment_summary(budget or instance.budget_limit, payments_matrix)
     d = float("inf")
 
-    for p in projects:
-        if p in selected_projects:
-            continue
-        gp = greedy_project_change_approvals(
-            instance, profile, selected_projects, payments, p
-        )
+    # Unselected projects have no paying supporters
+    results = _map_over_projects(
+        greedy_project_change_approvals,
+        (instance, profile, selected_projects, payments_matrix),
+        [(p, approval_masks[p], payment_summary, 0) for p in projects if p not in selected_projects],
+        n_jobs
+    )
+    for gp in results:
         if gp > 0:
             d = min(d, gp)
 
@@ -272,49 +418,71 @@ def add_opt_approval_heuristic(
 
 def _compute_L_lists(
     profile: List,
-    sorted_selected_with_bpb: List[Tuple],
-    payments: Dict,
+    payments_matrix: np.ndarray,
     shares: Dict
-) -> List[List]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compute the L_1, ..., L_{w+1} lists for uniform utilities.
     
-    L[i] contains (voter, cumulative_budget) pairs sorted by budget.
+    Row k of the L matrix holds each voter's share plus their payments to the
+    first k selected projects (columns of payments_matrix, in selection
+    order). Returns (sort_idx, sorted_values), both of shape
+    (w+1, num_voters), where sort_idx[k] orders the voters (profile rows)
+    by their cumulative budget at level k.
     """
-    budget_list = [[v, shares[v['name']]] for v in profile]
-    budget_list.sort(key=lambda x: x[1])
-    L0 = copy.deepcopy(budget_list)
+    payments_by_selected = payments_matrix.T
 
-    L = [copy.deepcopy(L0)]
+    L_matrix = np.empty((len(payments_by_selected) + 1, len(profile)), dtype=object)
+    L_matrix[0] = build_shares_array(profile, shares)
+    L_matrix[1:] = L_matrix[0] + np.cumsum(payments_by_selected, axis=0)
+
+    sort_idx = np.argsort(L_matrix, axis=1, kind="stable")
+    return sort_idx, np.take_along_axis(L_matrix, sort_idx, axis=1)
+
+
+def _approval_masks(profile: List, projects) -> Dict:
+    """
+    Compute the supporter mask of every project (columns of the approval matrix).
     
-    for k in range(1, len(sorted_selected_with_bpb) + 1):
-        L_curr = copy.deepcopy(L[-1])
-        project = sorted_selected_with_bpb[k - 1][0]
-        
-        for i in range(len(L_curr)):
-            voter_name = L_curr[i][0]['name']
-            L_curr[i][1] += payments.get((voter_name, project), 0)
-        
-        L_curr.sort(key=lambda x: x[1])
-        L.append(L_curr)
+    Returns:
+        Dict mapping project -> boolean array over profile rows
+    """
+    approval_matrix = build_approval_matrix(profile, projects)
+    return {project: approval_matrix[:, j] for j, project in enumerate(projects)}
 
-    return L
 
+def _supporters_not_paying_masks(
+    approval_masks: Dict,
+    selected_projects: List,
+    payments_matrix: np.ndarray
+) -> Dict:
+    """
+    Compute the O_p(X) voter mask for every project.
+    
+    Args:
+        approval_masks: Dict mapping project -> supporter mask (see _approval_masks)
+        selected_projects: Selected projects (columns of payments_matrix)
+        payments_matrix: Dense payment matrix
+    
+    Returns:
+        Dict mapping project -> boolean array over profile rows, True for
+        supporters of the project that are not paying for it
+    """
+    return {
+        project: supports & (_own_payments(payments_matrix, selected_projects, project) == 0)
+        for project, supports in approval_masks.items()
+    }
 
-def _get_L_Op(L: List[List], project, payments: Dict) -> List[List]:
+
+def _get_L_Op(L: Tuple[np.ndarray, np.ndarray], mask: np.ndarray) -> np.ndarray:
     """
-    Filter L lists to only include supporters of project not paying for it.
+    Filter L lists to only include the voters selected by mask (O_p(X)).
+    
+    Every level is a permutation of all voters, so each keeps the same number
+    of entries and the result is a (w+1, |O_p(X)|) matrix, still sorted per row.
     """
-    new_list = []
-    for project_list in L:
-        new_proj_list = []
-        for pair in project_list:
-            if (project in pair[0]['approved'] and 
-                payments.get((pair[0]['name'], project), 0) == 0):
-                new_proj_list.append(pair)
-        new_proj_list.sort(key=lambda x: x[1])
-        new_list.append(new_proj_list)
-    return new_list
+    sort_idx, values = L
+    return values[mask[sort_idx]].reshape(len(values), -1)
 
 
 def add_opt_cost(
@@ -322,12 +490,13 @@ def add_opt_cost(
     profile,
     sorted_selected_with_bpb,
     payments: Dict,
-    shares: Dict
+    shares: Dict,
+    n_jobs: Optional[int] = 1
 ) -> float:
     """
     Compute minimum budget increase for outcome instability (uniform/cost utilities).
     
-    This implements Algorithm 5 from the paper.
+    This implements Algorithm 5 from the paper. See add_opt_approval for n_jobs.
     """
     profile = profile_preprocessing(profile)
     
@@ -338,14 +507,28 @@ def add_opt_cost(
     projects = instance.project_meta
     d = float("inf")
 
-    # Compute L lists
-    L = _compute_L_lists(profile, sorted_selected_with_bpb, payments, shares)
+    selected = [p for p, _ in sorted_selected_with_bpb]
+    payments_matrix = build_payments_matrix(profile, selected, payments)
 
-    for p in projects:
-        L_Op = _get_L_Op(L, p, payments)
-        gp = greedy_project_change_uniform(
-            instance, profile, sorted_selected_with_bpb, payments, p, L_Op, cost_utility
-        )
+    # Compute L lists
+    L = _compute_L_lists(profile, payments_matrix, shares)
+    approval_masks = _approval_masks(profile, projects)
+    O_p_masks = _supporters_not_paying_masks(approval_masks, selected, payments_matrix)
+    support_counts = {p: int(np.count_nonzero(mask)) for p, mask in approval_masks.items()}
+
+    results = _map_over_projects(
+        greedy_project_change_uniform,
+        (instance, profile, sorted_selected_with_bpb, payments_matrix),
+        [
+            (
+                p, _get_L_Op(L, O_p_masks[p]), cost_utility,
+                support_counts[p], np.flatnonzero(O_p_masks[p])
+            )
+            for p in projects
+        ],
+        n_jobs
+    )
+    for gp in results:
         if gp > 0:
             d = min(d, gp)
 
@@ -357,10 +540,13 @@ def add_opt_cost_heuristic(
     profile,
     sorted_selected_with_bpb,
     payments: Dict,
-    shares: Dict
+    shares: Dict,
+    n_jobs: Optional[int] = 1
 ) -> float:
     """
     ADD-OPT heuristic: only consider unselected projects (uniform/cost utilities).
+    
+    See add_opt_approval for n_jobs.
     """
     profile = profile_preprocessing(profile)
     
@@ -371,15 +557,27 @@ def add_opt_cost_heuristic(
     projects = instance.project_meta
     d = float("inf")
 
-    L = _compute_L_lists(profile, sorted_selected_with_bpb, payments, shares)
-
-    for p in projects:
-        if p in selected_projects:
-            continue
-        L_Op = _get_L_Op(L, p, payments)
-        gp = greedy_project_change_uniform(
-            instance, profile, sorted_selected_with_bpb, payments, p, L_Op, cost_utility
-        )
+    selected = [p for p, _ in sorted_selected_with_bpb]
+    payments_matrix = build_payments_matrix(profile, selected, payments)
+
+    L = _compute_L_lists(profile, payments_matrix, shares)
+    approval_masks = _approval_masks(profile, projects)
+    O_p_masks = _supporters_not_paying_masks(approval_masks, selected, payments_matrix)
+    support_counts = {p: int(np.count_nonzero(mask)) for p, mask in approval_masks.items()}
+
+    results = _map_over_projects(
+        greedy_project_change_uniform,
+        (instance, profile, sorted_selected_with_bpb, payments_matrix),
+        [
+            (
+                p, _get_L_Op(L, O_p_masks[p]), cost_utility,
+                support_counts[p], np.flatnonzero(O_p_masks[p])
+            )
+            for p in projects if p not in selected_projects
+        ],
+        n_jobs
+    )
+    for gp in results:
         if gp > 0:
             d = min(d, gp)
 
@@ -0,0 +1,121 @@
+"""
+On-disk cache for parsed pabulib instances.
+
+Parsing a pabulib file and preprocessing its profile is repeated by every
+experiment run on the same instance. The parsed (instance, profile) pair is
+pickled next to the source file and reused as long as the source is
+unchanged (same size and modification time).
+
+Environment variables:
+- PB_CACHE=0 disables the cache: every call parses the file.
+- PB_CACHE_DIR=<dir> keeps the cache files in <dir> instead of next to
+  the source files (e.g. for read-only or shared dataset directories).
+- PB_FAST_PABULIB=1 parses cache misses with the single-pass scanner in
+  fast_pabulib instead of parse_pabulib.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, Tuple, Any
+
+from pabutools.election import parse_pabulib
+
+from .fast_pabulib import parse_pabulib_fast
+from .utils import profile_preprocessing
+
+CACHE_SUFFIX = ".pbcache.pkl"
+
+# Bumped whenever the pickled profile format changes, so older caches are
+# rebuilt rather than loaded
+CACHE_FORMAT = 2
+
+USE_CACHE = os.environ.get("PB_CACHE", "1") != "0"
+CACHE_DIR = os.environ.get("PB_CACHE_DIR") or None
+
+# Feature flag for the single-pass parser
+USE_FAST_PARSER = os.environ.get("PB_FAST_PABULIB", "0") == "1"
+
+
+def _source_signature(pabulib_file: Path) -> Tuple[int, int, int]:
+    """Cache format, size and modification time (ns) identifying the current file contents."""
+    stat = pabulib_file.stat()
+    return CACHE_FORMAT, stat.st_size, stat.st_mtime_ns
+
+
+def _cache_path(source: Path, cache_dir: Optional[str]) -> Path:
+    """Cache file for source: next to it, or in cache_dir keyed by its full path."""
+    if cache_dir is None:
+        return source.with_name(source.name + CACHE_SUFFIX)
+    # Files with the same name in different directories must not collide
+    digest = hashlib.sha1(str(source.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{source.name}.{digest}{CACHE_SUFFIX}"
+
+
+def _parse(source: Path) -> Tuple[Any, list]:
+    """Parse and preprocess source, bypassing the cache."""
+    if USE_FAST_PARSER:
+        return parse_pabulib_fast(str(source))
+    instance, profile = parse_pabulib(str(source))
+    return instance, profile_preprocessing(profile)
+
+
+def load_instance_cached(
+    pabulib_file: str,
+    use_cache: Optional[bool] = None,
+    cache_dir: Optional[str] = None,
+) -> Tuple[Any, list]:
+    """
+    Parse a pabulib file and preprocess its profile, using the on-disk cache.
+
+    The cache lives at <file>.pbcache.pkl, or in cache_dir when one is
+    given. It is rebuilt when missing, unreadable or stale; if it cannot
+    be written (e.g. a read-only data directory) the freshly parsed result
+    is returned uncached.
+
+    Args:
+        pabulib_file: Path to the pabulib (.pb) file
+        use_cache: Whether to read and write the cache (default: PB_CACHE)
+        cache_dir: Directory for the cache files (default: PB_CACHE_DIR,
+            or next to the source file)
+
+    Returns:
+        Tuple of (instance, preprocessed profile), as returned by
+        parse_pabulib followed by profile_preprocessing
+    """
+    source = Path(pabulib_file)
+    if not (USE_CACHE if use_cache is None else use_cache):
+        return _parse(source)
+
+    cache_file = _cache_path(source, CACHE_DIR if cache_dir is None else cache_dir)
+    signature = _source_signature(source)
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_signature, instance, profile = pickle.load(f)
+        if cached_signature == signature:
+            return instance, profile
+    except Exception:
+        # Missing, truncated, corrupt or written in an older format:
+        # unpickling arbitrary bytes can raise almost anything, and any of
+        # these just means the cache is rebuilt
+        pass
+
+    instance, profile = _parse(source)
+
+    # Write to a temporary file first so concurrent runs never read a
+    # partially written cache
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump((signature, instance, profile), f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+    return instance, profile
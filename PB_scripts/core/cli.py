@@ -7,6 +7,7 @@ and results file handling.
 """
 
 import os
+import csv
 import argparse
 import traceback
 from typing import Callable, Any, Optional
@@ -66,6 +67,45 @@ def save_results(df, filepath: Path, filename: str) -> bool:
         return False
 
 
+def _write_row_csv(row: dict, path: Path) -> None:
+    """Write row as a header line plus one data line, like DataFrame.to_csv(index=False)."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(row), lineterminator="\n")
+        writer.writeheader()
+        writer.writerow(row)
+
+
+def save_results_dict(row: dict, filepath: Path, filename: str) -> bool:
+    """
+    Save a single results row to CSV, with fallback to /tmp.
+    
+    Writes the same file as save_results on a one-row DataFrame with the
+    row's keys as columns, without needing pandas.
+    
+    Args:
+        row: Mapping of column name -> value
+        filepath: Primary save location
+        filename: Name of the CSV file
+        
+    Returns:
+        True if saved successfully
+    """
+    full_path = filepath / filename
+    
+    try:
+        _write_row_csv(row, full_path)
+        return True
+    except PermissionError:
+        # Fallback to /tmp
+        fallback = Path("/tmp") / filename
+        _write_row_csv(row, fallback)
+        print(f"Warning: Saved to {fallback} due to permission error")
+        return True
+    except Exception as e:
+        print(f"Error saving results: {e}")
+        return False
+
+
 def create_argument_parser(description: str = "Run PB experiment") -> argparse.ArgumentParser:
     """
     Create a standard argument parser for PB experiments.
@@ -98,7 +138,8 @@ def run_experiment(
     - Results file saving
     
     Args:
-        experiment_func: Function that takes (pabulib_file, budget) and returns a DataFrame
+        experiment_func: Function that takes (pabulib_file, budget) and returns a
+            results row (dict) or a DataFrame
         results_subdir: Subdirectory under results/ to save output
         description: Description for help text
     """
@@ -108,13 +149,16 @@ def run_experiment(
     results_dir = setup_results_dir(results_subdir)
     
     try:
-        df = experiment_func(args.pabulib_file, args.budget)
+        results = experiment_func(args.pabulib_file, args.budget)
         
-        if df is not None:
+        if results is not None:
             # Generate filename from input file
             input_name = Path(args.pabulib_file).stem
             output_filename = f"{input_name}_results.csv"
-            save_results(df, results_dir, output_filename)
+            if isinstance(results, dict):
+                save_results_dict(results, results_dir, output_filename)
+            else:
+                save_results(results, results_dir, output_filename)
             
     except Exception as e:
         print(f"Error running experiment: {e}")
@@ -5,138 +5,257 @@ This module contains the core EES algorithm that can be parameterized
 by different utility functions (cardinal/approval or cost/uniform).
 """
 
-from typing import Callable, Dict, List, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from collections import OrderedDict
 from functools import partial
-import pandas as pd
+import numpy as np
 
 from .utils import (
     profile_preprocessing,
     cardinal_utility,
     cost_utility,
-    filter_sd,
-    calculate_bang_per_buck,
-    get_project_support,
-    initialize_payments,
+    calculate_bang_per_buck_batch,
+    build_approval_matrix,
+    PaymentsDictView,
+    SharesDictView,
     initialize_shares,
+    initialize_payments_array,
+    as_float_array,
+    njit,
 )
 
 
-def exact_method_of_equal_shares(
-    instance,
-    profile,
-    utility_function: Callable = cardinal_utility,
-    budget: float = 0
-) -> Tuple[OrderedDict, Dict, Dict, float]:
+@njit(cache=True)
+def _find_feasible_index(sorted_shares, cost) -> int:
     """
-    Run the Exact Method of Equal Shares algorithm.
+    Find the first supporter who can afford an equal share of cost.
     
-    This is the core EES implementation that selects projects by highest
-    bang-per-buck, where only voters who can afford equal shares contribute.
+    sorted_shares are the supporters' shares in ascending order; the i
+    poorest are excluded and the remaining n - i split the cost equally.
+    The predicate is not monotone in i, but the price only grows as voters
+    drop out, so every share below the current price can be skipped with a
+    binary search instead of being tested one by one.
+    
+    Returns:
+        The smallest i with cost / (n - i) <= sorted_shares[i], or -1 if none
+    """
+    n = len(sorted_shares)
+    i = 0
+    while i < n:
+        price = cost / (n - i)
+        if price <= sorted_shares[i]:
+            return i
+        i = int(np.searchsorted(sorted_shares, price))
+    return -1
+
+
+def _ees_setup(projects, profile, utility_function: Callable) -> Dict[str, Any]:
+    """
+    Precompute the budget-independent EES data for a preprocessed profile.
+    
+    Supporter sets, utilities and the voter x project approval matrix do
+    not depend on the budget, so callers that re-run EES for several budgets
+    (see exact_method_of_equal_shares_add_one) compute them only once.
+    """
+    approval_matrix = build_approval_matrix(profile, projects)
+    project_support_idx = {
+        project: np.flatnonzero(approval_matrix[:, j])
+        for j, project in enumerate(projects)
+    }
+
+    return {
+        'utility_function': utility_function,
+        'projects': projects,
+        'profile': profile,
+        'project_support_idx': project_support_idx,
+        'approval_matrix': approval_matrix,
+        'utilities': np.array([utility_function(project) for project in projects], dtype=object),
+        'costs': np.array([project.cost for project in projects], dtype=object),
+    }
+
+
+def prepare_ees_setup(instance, profile, utility_function: Callable = cardinal_utility) -> Dict[str, Any]:
+    """
+    Precompute the budget-independent EES data for an instance and profile.
+    
+    Completion loops re-run EES on the same instance and profile with a
+    growing budget; they can build the setup once and pass it to
+    exact_method_of_equal_shares (and its wrappers) as setup=. The setup
+    reflects the costs and ballots at the time it is built.
     
     Args:
-        instance: Pabulib instance with budget_limit and project_meta
+        instance: Pabulib instance with project_meta
         profile: Voter profile (will be preprocessed if needed)
         utility_function: Function mapping project -> utility (default: cardinal)
-        budget: Optional budget override (uses instance.budget_limit if 0)
-        
-    Returns:
-        Tuple of:
-        - funded_projects: OrderedDict mapping project -> bang_per_buck (in selection order)
-        - X_payments: Dict mapping (voter_name, project) -> payment amount
-        - shares: Dict mapping voter_name -> remaining budget
-        - total_cost: Total cost of selected projects
     """
-    if budget > 0:
-        instance.budget_limit = budget
+    return _ees_setup(instance.project_meta, profile_preprocessing(profile), utility_function)
 
-    budget = instance.budget_limit
-    projects = instance.project_meta
 
-    # Preprocess profile
-    profile = profile_preprocessing(profile)
-    num_voters = len(profile)
+def _ees_run(setup: Dict[str, Any], budget) -> Tuple[OrderedDict, Dict, Dict, float]:
+    """
+    Run the EES selection loop for one budget on data from _ees_setup.
     
+    Returns the same tuple as exact_method_of_equal_shares.
+    """
+    projects = setup['projects']
+    project_support_idx = setup['project_support_idx']
+    approval_matrix = setup['approval_matrix']
+    project_list = list(projects)
+
     # Initialize data structures
-    X_payments = initialize_payments(profile, projects)
-    shares = initialize_shares(profile, budget)
-    funded_projects = OrderedDict()
+    X_payments, voter_idx, project_idx = initialize_payments_array(setup['profile'], projects)
+    shares = initialize_shares(setup['profile'], budget)
+
+    # Use the compiled feasibility kernel when shares and costs are plain
+    # floats; exact rationals (the pabutools default) stay on the Python path.
+    float_costs = as_float_array(setup['costs'])
+    float_utilities = as_float_array(setup['utilities'])
+    if shares.dtype == np.float64 and float_costs is not None and float_utilities is not None:
+        find_feasible_index = _find_feasible_index
+        costs, utilities, payers_dtype = float_costs, float_utilities, np.int64
+    else:
+        shares = shares.astype(object)
+        find_feasible_index = _find_feasible_index.py_func
+        costs, utilities, payers_dtype = setup['costs'], setup['utilities'], object
+
+    # Funded projects in selection order, their bang-per-buck and a
+    # per-project "is funded" flag for the candidate scan
+    funded_list = []
+    funded_bpb = []
+    funded_mask = [False] * len(project_idx)
     total_cost = 0
-    project_support = get_project_support(projects, profile)
 
-    while True:
-        best_project = None
-        max_bang_per_buck = 0
-        best_index = 0
-        best_supp_shares = None
+    # Each project's supporters sorted by current share. Only the shares of
+    # the last winner's payers change, so only projects they support are
+    # re-sorted in the next round.
+    sorted_support = {}
+    stale_projects = np.ones(len(project_idx), dtype=bool)
 
-        # Sort all voter shares once per iteration
-        supp_shares_base = sorted(shares.items(), key=lambda item: item[1])
+    while True:
+        # Affordable candidates: project position, first paying supporter
+        # (in share order) and number of payers
+        candidates, first_payers, num_payers = [], [], []
 
-        for project in projects:
-            if project in funded_projects:
+        for j, project in enumerate(projects):
+            if funded_mask[j]:
                 continue
 
-            if not project_support[project]:
+            supporters_idx = project_support_idx[project]
+            if len(supporters_idx) == 0:
                 continue
 
-            # Filter to only supporters of this project
-            supp_shares = filter_sd(supp_shares_base, project_support[project])
-
-            number_paying_voters = len(supp_shares)
-            for i in range(len(supp_shares)):
-                max_contribution = project.cost / number_paying_voters
-                
-                if max_contribution <= supp_shares[i][1]:
-                    bang_per_buck = calculate_bang_per_buck(
-                        project, number_paying_voters, utility_function
-                    )
-                    
-                    if bang_per_buck > max_bang_per_buck:
-                        max_bang_per_buck = bang_per_buck
-                        best_project = (project, bang_per_buck)
-                        best_index = i
-                        best_supp_shares = supp_shares
-                    elif bang_per_buck == max_bang_per_buck and best_project is not None:
-                        # Tie-breaking: larger project name wins
-                        if project.name > best_project[0].name:
-                            best_project = (project, bang_per_buck)
-                            best_index = i
-                            best_supp_shares = supp_shares
-                    break
-                number_paying_voters -= 1
-
-        if best_project is None:
+            if stale_projects[j]:
+                supp_shares = shares[supporters_idx]
+                order = np.argsort(supp_shares, kind="stable")
+                sorted_support[project] = (supporters_idx[order], supp_shares[order])
+            supp_shares = sorted_support[project][1]
+
+            i = find_feasible_index(supp_shares, project.cost)
+            if i >= 0:
+                candidates.append(j)
+                first_payers.append(i)
+                num_payers.append(len(supp_shares) - i)
+
+        if not candidates:
             break
 
+        bang_per_buck = calculate_bang_per_buck_batch(
+            utilities[candidates], np.array(num_payers, dtype=payers_dtype), costs[candidates]
+        ).tolist()
+        max_bang_per_buck = max(bang_per_buck)
+        if not max_bang_per_buck > 0:
+            break
+
+        # Tie-breaking: larger project name wins
+        best = None
+        for k, value in enumerate(bang_per_buck):
+            if value == max_bang_per_buck and (
+                best is None or project_list[candidates[k]].name > project_list[candidates[best]].name
+            ):
+                best = k
+
+        best_project = (project_list[candidates[best]], bang_per_buck[best])
+        best_index = first_payers[best]
+        best_supp_idx = sorted_support[best_project[0]][0]
+
         # Fund the project
-        contribution = best_project[0].cost / (len(best_supp_shares) - best_index)
+        contribution = best_project[0].cost / (len(best_supp_idx) - best_index)
 
-        for voter_name, _ in best_supp_shares[best_index:]:
-            shares[voter_name] -= contribution
-            X_payments[(voter_name, best_project[0])] = contribution
+        best_project_idx = project_idx[best_project[0]]
+        payers = best_supp_idx[best_index:]
+        shares[payers] -= contribution
+        X_payments[payers, best_project_idx] = contribution
+        stale_projects = approval_matrix[payers].any(axis=0)
 
-        funded_projects[best_project[0]] = best_project[1]
+        funded_list.append(best_project[0])
+        funded_bpb.append(best_project[1])
+        funded_mask[best_project_idx] = True
         total_cost += best_project[0].cost
 
+    funded_projects = OrderedDict(zip(funded_list, funded_bpb))
+    shares = SharesDictView(shares, voter_idx)
+    X_payments = PaymentsDictView(X_payments, voter_idx, project_idx)
     return funded_projects, X_payments, shares, total_cost
 
 
+def exact_method_of_equal_shares(
+    instance,
+    profile,
+    utility_function: Callable = cardinal_utility,
+    budget: float = 0,
+    setup: Optional[Dict[str, Any]] = None,
+) -> Tuple[OrderedDict, Dict, Dict, float]:
+    """
+    Run the Exact Method of Equal Shares algorithm.
+    
+    This is the core EES implementation that selects projects by highest
+    bang-per-buck, where only voters who can afford equal shares contribute.
+    
+    Args:
+        instance: Pabulib instance with budget_limit and project_meta
+        profile: Voter profile (will be preprocessed if needed)
+        utility_function: Function mapping project -> utility (default: cardinal)
+        budget: Budget to run with (uses instance.budget_limit if 0); the
+            instance itself is not modified
+        setup: Result of prepare_ees_setup for this instance, profile and
+            utility_function (computed here if omitted)
+        
+    Returns:
+        Tuple of:
+        - funded_projects: OrderedDict mapping project -> bang_per_buck (in selection order)
+        - X_payments: PaymentsDictView mapping (voter_name, project) -> payment amount
+        - shares: SharesDictView mapping voter_name -> remaining budget
+        - total_cost: Total cost of selected projects
+    """
+    if budget <= 0:
+        budget = instance.budget_limit
+
+    if setup is None:
+        setup = prepare_ees_setup(instance, profile, utility_function)
+    elif setup['utility_function'] is not utility_function:
+        raise ValueError("setup was prepared for a different utility function")
+    return _ees_run(setup, budget)
+
+
 # Convenience wrappers for specific utility functions
 
 def exact_method_of_equal_shares_approval(
     instance,
     profile,
-    budget: float = 0
+    budget: float = 0,
+    setup: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List, Dict, Dict, float]:
     """
     EES with cardinal/approval utility (u(p) = 1).
     
+    setup, if given, must come from prepare_ees_setup(instance, profile,
+    cardinal_utility).
+    
     Returns:
         Tuple of (selected_projects_list, payments, shares, total_cost)
     """
     funded_projects, payments, shares, total_cost = exact_method_of_equal_shares(
-        instance, profile, utility_function=cardinal_utility, budget=budget
+        instance, profile, utility_function=cardinal_utility, budget=budget, setup=setup
     )
     return list(funded_projects.keys()), payments, shares, total_cost
 
@@ -144,16 +263,20 @@ def exact_method_of_equal_shares_approval(
 def exact_method_of_equal_shares_cost(
     instance,
     profile,
-    budget: float = 0
+    budget: float = 0,
+    setup: Optional[Dict[str, Any]] = None,
 ) -> Tuple[OrderedDict, Dict, Dict, float]:
     """
     EES with cost/uniform utility (u(p) = cost(p)).
     
+    setup, if given, must come from prepare_ees_setup(instance, profile,
+    cost_utility).
+    
     Returns:
         Tuple of (funded_projects_with_bpb, payments, shares, total_cost)
     """
     return exact_method_of_equal_shares(
-        instance, profile, utility_function=cost_utility, budget=budget
+        instance, profile, utility_function=cost_utility, budget=budget, setup=setup
     )
 
 def exact_method_of_equal_shares_approval_add_one(
@@ -177,21 +300,32 @@ def exact_method_of_equal_shares_add_one(
     stop_on_overspend:bool = True,
 ) -> Tuple[List, Dict, Dict, float, int]:
     
+    match utility_type:
+        case "cardinal":
+            utility_function = cardinal_utility
+        case "cost":
+            utility_function = cost_utility
+        case _:
+            raise ValueError("Please specify either cardinal or cost utilities")
+
     initial_budget = int(instance.budget_limit)
+    budget = instance.budget_limit
     increase_counter = 0
 
     highest_spend_so_far = 0
     best_result_so_far = []
 
+    # Only the budget changes between iterations, so the profile and the
+    # supporter/utility data are prepared once and reused by every run
+    setup = prepare_ees_setup(instance, profile, utility_function)
+
     while True:
-        match utility_type:
-            case "cardinal":
-                funded_projects, payments, shares, total_cost = exact_method_of_equal_shares_approval(instance, profile)
-            case "cost":
-                funded_projects, payments, shares, total_cost = exact_method_of_equal_shares_cost(instance, profile)
-            case _:
-                raise ValueError("Please specify either cardinal or cost utilities")
+        funded_projects, payments, shares, total_cost = _ees_run(setup, budget)
+        if utility_type == "cardinal":
+            funded_projects = list(funded_projects.keys())
         
+        # EES is not monotone in the budget, so overspend cannot be predicted
+        # from the previous run and each budget has to be tried
         if stop_on_overspend and total_cost > initial_budget:
             break
 
@@ -203,31 +337,49 @@ def exact_method_of_equal_shares_add_one(
             break
 
         increase_counter += 1
-        instance.budget_limit = instance.budget_limit + 1
+        budget = budget + 1
 
     funded_projects, payments, shares, total_cost = best_result_so_far
     return funded_projects, payments, shares, total_cost, increase_counter
 
-def create_ees_results_df(
+def create_ees_results_row(
     result,
     efficiency: float,
     budget_increase_count: int,
     max_increase: float = 0,
     min_increase: float = 0,
     avg_increase: float = 0,
-) -> pd.DataFrame:
+) -> Dict[str, Any]:
     """
-    Create a standardized results DataFrame for MES experiments.
+    Create a standardized results row for EES experiments.
     """
-    data = {
-        'selected_projects': [result],
-        'efficiency': [efficiency],
-        'budget_increase_count': [budget_increase_count],
-        'max_budget_increase': [max_increase],
-        'min_budget_increase': [min_increase],
-        'avg_budget_increase': [avg_increase],
+    return {
+        'selected_projects': result,
+        'efficiency': efficiency,
+        'budget_increase_count': budget_increase_count,
+        'max_budget_increase': max_increase,
+        'min_budget_increase': min_increase,
+        'avg_budget_increase': avg_increase,
     }
-    return pd.DataFrame(data)
+
+
+def create_ees_results_df(
+    result,
+    efficiency: float,
+    budget_increase_count: int,
+    max_increase: float = 0,
+    min_increase: float = 0,
+    avg_increase: float = 0,
+):
+    """
+    Create a standardized results DataFrame for EES experiments.
+    """
+    import pandas as pd
+
+    row = create_ees_results_row(
+        result, efficiency, budget_increase_count, max_increase, min_increase, avg_increase
+    )
+    return pd.DataFrame({column: [value] for column, value in row.items()})
 
 
 # Alias for backwards compatibility
@@ -0,0 +1,104 @@
+"""
+Single-pass parser for approval pabulib files.
+
+parse_pabulib builds a pabutools ballot per voter, deep-copies the ballots
+into an ApprovalProfile and profile_preprocessing then copies every ballot
+once more. When only the approval sets are needed, the VOTES section can be
+read straight into the preprocessed format instead. The (small) META and
+PROJECTS sections are still parsed by pabutools, so the instance is exactly
+the one parse_pabulib returns.
+"""
+
+import mmap
+import os
+import re
+from typing import Any, List, Tuple
+
+from pabutools.election import parse_pabulib
+from pabutools.election.pabulib import parse_pabulib_from_string
+
+from .utils import Voter, profile_preprocessing
+
+# Header line of the VOTES section (matched the way pabutools does:
+# first field, case-insensitive, surrounding whitespace ignored)
+_VOTES_SECTION = re.compile(rb"(?im)^[ \t]*votes[ \t]*(?:;[^\r\n]*)?\r?$")
+_OTHER_SECTIONS = (b"meta", b"projects")
+_APPROVAL_VOTE_TYPES = ("approval", "choose-1")
+
+
+class _UnsupportedSchema(Exception):
+    """The file needs the full pabutools parser."""
+
+
+def _parse_votes(votes: bytes, projects_by_name: dict) -> List[Voter]:
+    """Read the VOTES section (header line first) into preprocessed Voters."""
+    lines = iter(votes.splitlines())
+    header = [column.strip() for column in next(lines, b"").split(b";")]
+    if b"vote" not in header:
+        raise _UnsupportedSchema("no vote column")
+    vote_col = header.index(b"vote")
+
+    profile = []
+    for line in lines:
+        if not line.strip():
+            continue
+        if b'"' in line:
+            raise _UnsupportedSchema("quoted fields")
+        fields = line.split(b";")
+        if fields[0].strip().lower() in _OTHER_SECTIONS:
+            raise _UnsupportedSchema("section after VOTES")
+
+        vote = fields[vote_col].strip().decode("utf-8")
+        if vote.lower() == "none":
+            raise _UnsupportedSchema("missing vote")
+        try:
+            approved = frozenset(projects_by_name[name] for name in vote.split(",") if name)
+        except KeyError:
+            raise _UnsupportedSchema("unknown project")
+
+        profile.append(Voter(name=len(profile) + 1, approved=approved))
+    return profile
+
+
+def _parse_mapped(pabulib_file: str, data) -> Tuple[Any, List[Voter]]:
+    match = _VOTES_SECTION.search(data)
+    if match is None:
+        raise _UnsupportedSchema("no VOTES section")
+
+    instance, _ = parse_pabulib_from_string(data[:match.start()].decode("utf-8-sig"))
+    if instance.meta.get("vote_type") not in _APPROVAL_VOTE_TYPES:
+        raise _UnsupportedSchema("not an approval election")
+
+    projects_by_name = {project.name: project for project in instance}
+    profile = _parse_votes(data[match.end():].lstrip(b"\r\n"), projects_by_name)
+
+    instance.file_path = pabulib_file
+    instance.file_name = os.path.basename(pabulib_file)
+    return instance, profile
+
+
+def parse_pabulib_fast(pabulib_file: str) -> Tuple[Any, List[Voter]]:
+    """
+    Parse an approval pabulib file straight into a preprocessed profile.
+
+    Files the scanner does not handle (non-approval ballots, quoted
+    fields, unusual section layout, ...) fall back to parse_pabulib
+    followed by profile_preprocessing, so the result is the same either way.
+
+    Args:
+        pabulib_file: Path to the pabulib (.pb) file
+
+    Returns:
+        Tuple of (instance, preprocessed profile)
+    """
+    try:
+        with open(pabulib_file, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _parse_mapped(pabulib_file, data)
+    except (_UnsupportedSchema, ValueError, KeyError, IndexError):
+        # ValueError also covers empty files (which cannot be mapped) and
+        # undecodable bytes
+        pass
+
+    instance, profile = parse_pabulib(pabulib_file)
+    return instance, profile_preprocessing(profile)
@@ -5,9 +5,10 @@ This module wraps pabutools MES functionality with common patterns
 used in the experiment scripts.
 """
 
+from typing import Any, Dict
+
 from pabutools.rules import method_of_equal_shares
 from pabutools.election import Cardinality_Sat, Cost_Sat
-import pandas as pd
 
 
 def run_mes_approval(instance, profile):
@@ -111,6 +112,27 @@ def mes_with_budget_increase_exhaustion(
     return best_result_so_far, efficiency, increase_counter
 
 
+def create_mes_results_row(
+    result,
+    efficiency: float,
+    budget_increase_count: int,
+    max_increase: float = 0,
+    min_increase: float = 0,
+    avg_increase: float = 0,
+) -> Dict[str, Any]:
+    """
+    Create a standardized results row for MES experiments.
+    """
+    return {
+        'selected_projects': list(result),
+        'efficiency': efficiency,
+        'budget_increase_count': budget_increase_count,
+        'max_budget_increase': max_increase,
+        'min_budget_increase': min_increase,
+        'avg_budget_increase': avg_increase,
+    }
+
+
 def create_mes_results_df(
     result,
     efficiency: float,
@@ -118,17 +140,14 @@ def create_mes_results_df(
     max_increase: float = 0,
     min_increase: float = 0,
     avg_increase: float = 0,
-) -> pd.DataFrame:
+):
     """
     Create a standardized results DataFrame for MES experiments.
     """
-    data = {
-        'selected_projects': [list(result)],
-        'efficiency': [efficiency],
-        'budget_increase_count': [budget_increase_count],
-        'max_budget_increase': [max_increase],
-        'min_budget_increase': [min_increase],
-        'avg_budget_increase': [avg_increase],
-    }
-    return pd.DataFrame(data)
+    import pandas as pd
+
+    row = create_mes_results_row(
+        result, efficiency, budget_increase_count, max_increase, min_increase, avg_increase
+    )
+    return pd.DataFrame({column: [value] for column, value in row.items()})
 
@@ -4,38 +4,66 @@ Common utility functions for Participatory Budgeting experiments.
 This module contains shared helper functions used across multiple experiment scripts.
 """
 
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Callable, Tuple
 from collections import OrderedDict
+from dataclasses import dataclass
+from collections.abc import Mapping
 
+import numpy as np
 
-def profile_preprocessing(profile) -> List[Dict[str, Any]]:
+try:
+    from gmpy2 import mpq as exact_fraction
+except ImportError:  # gmpy2 comes with pabutools; fall back to the stdlib type
+    from fractions import Fraction as exact_fraction
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit; keeps .py_func like a compiled function."""
+        def decorate(func):
+            func.py_func = func
+            return func
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return decorate(args[0])
+        return decorate
+
+
+@dataclass(slots=True)
+class Voter:
+    """A preprocessed voter: 1-based ID and the set of approved projects."""
+    name: int
+    approved: frozenset
+
+
+def profile_preprocessing(profile) -> List[Voter]:
     """
     Preprocess a pabutools profile into a standardized format.
     
-    Converts a profile (list of voter ballots) into a list of dictionaries
-    with 'approved' (list of approved projects) and 'name' (voter ID) keys.
+    Converts a profile (list of voter ballots) into a list of Voter records
+    with 'approved' (frozenset of approved projects, for O(1) membership
+    tests) and 'name' (voter ID) attributes.
     
     Args:
-        profile: A pabutools profile or already-processed list of dicts
+        profile: A pabutools profile or already-processed list of Voters
         
     Returns:
-        List of dicts with 'approved' and 'name' keys
+        List of Voter records
     """
+    if not profile:
+        return []
+
     # Check if the input is already processed
-    if profile and isinstance(profile[0], dict) and "approved" in profile[0] and "name" in profile[0]:
+    first = profile[0]
+    if isinstance(first, Voter):
         return profile
 
-    to_return = []
-    
-    for i, voter in enumerate(profile):
-        voter_id = i + 1  # Using 1-based indexing for IDs
-        
-        to_return.append({
-            "approved": list(voter),  # Convert set to list
-            "name": voter_id
-        })
-    
-    return to_return
+    # Profiles preprocessed into the former dict format are upgraded
+    if isinstance(first, dict) and "approved" in first and "name" in first:
+        return [Voter(name=voter["name"], approved=frozenset(voter["approved"])) for voter in profile]
+
+    # Using 1-based indexing for IDs
+    return [Voter(name=i + 1, approved=frozenset(voter)) for i, voter in enumerate(profile)]
 
 
 def cardinal_utility(project) -> int:
@@ -69,20 +97,6 @@ def cost_utility(project):
     return project.cost
 
 
-def filter_sd(sd: List, keys_to_keep: List) -> List:
-    """
-    Filter a sorted list of (key, value) pairs to keep only specified keys.
-    
-    Args:
-        sd: Sorted list of (key, value) tuples
-        keys_to_keep: List of keys to retain
-        
-    Returns:
-        Filtered list maintaining original order
-    """
-    return [item for item in sd if item[0] in keys_to_keep]
-
-
 def calculate_bang_per_buck(project, number_paying_voters: int, utility_function: Callable) -> float:
     """
     Calculate the bang-per-buck ratio for a project.
@@ -100,48 +114,246 @@ def calculate_bang_per_buck(project, number_paying_voters: int, utility_function
     return utility_function(project) * number_paying_voters / project.cost
 
 
-def get_project_support(projects, profile: List[Dict]) -> Dict:
+@njit(cache=True)
+def _bang_per_buck_kernel(utilities, number_paying_voters, costs):
+    """Compiled loop behind calculate_bang_per_buck_batch for float64 inputs."""
+    out = np.empty(utilities.shape[0])
+    for i in range(utilities.shape[0]):
+        out[i] = utilities[i] * number_paying_voters[i] / costs[i]
+    return out
+
+
+def calculate_bang_per_buck_batch(
+    utilities: np.ndarray,
+    number_paying_voters: np.ndarray,
+    costs: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the bang-per-buck ratio for many projects at once.
+    
+    Element-wise utility * number_of_payers / cost, evaluated in the same
+    order as calculate_bang_per_buck. float64 inputs use a compiled loop;
+    object arrays (exact rationals) are combined element by element.
+    
+    Args:
+        utilities: Utility of each project
+        number_paying_voters: Number of voters who will pay for each project
+        costs: Cost of each project
+        
+    Returns:
+        Array of bang-per-buck ratios
+    """
+    if utilities.dtype == np.float64 and costs.dtype == np.float64:
+        return _bang_per_buck_kernel(utilities, number_paying_voters, costs)
+    return utilities * number_paying_voters / costs
+
+
+def compute_payer_counts(payments_matrix: np.ndarray, projects: List) -> Dict:
     """
-    Compute which voters support each project.
+    Count the paying voters of every project in one pass over the payments.
     
     Args:
-        projects: Iterable of project objects
-        profile: Preprocessed profile (list of voter dicts)
+        payments_matrix: Dense payment matrix whose columns follow projects
+            (see build_payments_matrix)
+        projects: Sequence of projects (the matrix columns)
         
     Returns:
-        Dict mapping project -> list of supporting voter names
+        Dict mapping project -> number of voters with a positive payment to it
     """
-    return {
-        project: [voter['name'] for voter in profile if project in voter['approved']]
-        for project in projects
-    }
+    counts = np.count_nonzero(payments_matrix > 0, axis=0)
+    return dict(zip(projects, counts.tolist()))
 
 
-def initialize_payments(profile: List[Dict], projects) -> Dict:
+def initialize_payments_array(profile: List[Voter], projects) -> Tuple[np.ndarray, Dict, Dict]:
     """
-    Initialize payment matrix with zeros.
+    Initialize a dense zero payment matrix with its row/column index maps.
+    
+    The matrix has object dtype so exact rational payments can be stored;
+    wrap it in a PaymentsDictView for (voter_name, project) lookups.
     
     Args:
         profile: Preprocessed profile
         projects: Iterable of projects
         
     Returns:
-        Dict mapping (voter_name, project) -> 0
+        Tuple of (zero matrix of shape (num_voters, num_projects),
+        dict voter_name -> row, dict project -> column)
+    """
+    voter_idx = {voter.name: i for i, voter in enumerate(profile)}
+    project_idx = {project: j for j, project in enumerate(projects)}
+    return np.zeros((len(voter_idx), len(project_idx)), dtype=object), voter_idx, project_idx
+
+
+def equal_share(budget, num_voters: int):
+    """
+    Divide a budget equally among num_voters voters.
+    
+    An integral budget is split into an exact rational share (like the
+    rational budgets pabutools parses), so payments subtracted later do not
+    accumulate floating-point error. Only a float budget gives a float share.
     """
-    return {(voter['name'], project): 0 for voter in profile for project in projects}
+    if isinstance(budget, int):
+        return exact_fraction(budget, num_voters)
+    return budget / num_voters
 
 
-def initialize_shares(profile: List[Dict], budget: float) -> Dict:
+def initialize_shares(profile: List[Voter], budget: float) -> np.ndarray:
     """
-    Initialize voter budget shares.
+    Initialize voter budget shares (see equal_share).
     
     Args:
         profile: Preprocessed profile
         budget: Total budget to divide equally
         
     Returns:
-        Dict mapping voter_name -> budget/num_voters
+        Array holding budget/num_voters for every profile row; float64 when
+        the share is a plain float, object dtype for exact rationals
     """
     num_voters = len(profile)
-    return {voter['name']: budget / num_voters for voter in profile}
+    share = equal_share(budget, num_voters)
+    dtype = np.float64 if isinstance(share, float) else object
+    return np.full(num_voters, share, dtype=dtype)
 
+
+class PaymentsDictView(Mapping):
+    """
+    Read-only dict-style view of a dense payment matrix.
+    
+    Maps (voter_name, project) -> matrix[voter_idx[voter_name], project_idx[project]],
+    so code written against the (voter_name, project) payments dict keeps
+    working while the algorithms index the matrix directly.
+    """
+
+    def __init__(self, matrix: np.ndarray, voter_idx: Dict, project_idx: Dict):
+        self.matrix = matrix
+        self.voter_idx = voter_idx
+        self.project_idx = project_idx
+
+    def __getitem__(self, key):
+        voter_name, project = key
+        return self.matrix[self.voter_idx[voter_name], self.project_idx[project]]
+
+    def __iter__(self):
+        for voter_name in self.voter_idx:
+            for project in self.project_idx:
+                yield (voter_name, project)
+
+    def __len__(self) -> int:
+        return len(self.voter_idx) * len(self.project_idx)
+
+
+class SharesDictView(Mapping):
+    """
+    Read-only dict-style view of a shares array.
+    
+    Maps voter_name -> array[voter_idx[voter_name]] (as a plain Python
+    number), mirroring PaymentsDictView for the remaining voter budgets.
+    """
+
+    def __init__(self, array: np.ndarray, voter_idx: Dict):
+        self.array = array
+        self.voter_idx = voter_idx
+
+    def __getitem__(self, voter_name):
+        return self.array.item(self.voter_idx[voter_name])
+
+    def __iter__(self):
+        return iter(self.voter_idx)
+
+    def __len__(self) -> int:
+        return len(self.voter_idx)
+
+
+def build_shares_array(profile: List[Voter], shares: Dict) -> np.ndarray:
+    """
+    Gather a shares dict into an object array in profile row order.
+    
+    Args:
+        profile: Preprocessed profile
+        shares: Dict (or SharesDictView) mapping voter_name -> remaining budget
+        
+    Returns:
+        Shares indexed by profile row
+    """
+    if isinstance(shares, SharesDictView):
+        rows = [shares.voter_idx[voter.name] for voter in profile]
+        return shares.array[rows].astype(object)
+    return np.array([shares[voter.name] for voter in profile], dtype=object)
+
+
+def build_payments_matrix(profile: List[Voter], projects: List, payments: Dict) -> np.ndarray:
+    """
+    Stack a payments dict into a dense (num_voters, num_projects) matrix.
+    
+    Row i holds the payments of profile[i], column j the payments towards
+    projects[j]. The matrix has object dtype so pabutools' exact rational
+    payments are kept as-is.
+    
+    Args:
+        profile: Preprocessed profile
+        projects: Sequence of projects (defines the column order)
+        payments: Dict (or PaymentsDictView) mapping (voter_name, project) -> payment amount
+        
+    Returns:
+        Payment matrix indexed by (voter row, project column)
+    """
+    if isinstance(payments, PaymentsDictView):
+        rows = [payments.voter_idx[voter.name] for voter in profile]
+        cols = [payments.project_idx[project] for project in projects]
+        return payments.matrix[np.ix_(rows, cols)]
+
+    voter_idx = {voter.name: i for i, voter in enumerate(profile)}
+    project_idx = {project: j for j, project in enumerate(projects)}
+    
+    matrix = np.zeros((len(profile), len(project_idx)), dtype=object)
+    for (voter_name, project), amount in payments.items():
+        j = project_idx.get(project)
+        if j is not None and amount:
+            matrix[voter_idx[voter_name], j] = amount
+    return matrix
+
+
+def build_approval_matrix(profile: List[Voter], projects) -> np.ndarray:
+    """
+    Build the boolean voter x project approval matrix.
+    
+    Column j is the supporter mask of the j-th project, so supporter sets,
+    counts and masks become array slices instead of scans over the ballots.
+    
+    Args:
+        profile: Preprocessed profile
+        projects: Iterable of projects (defines the column order)
+        
+    Returns:
+        Boolean array of shape (num_voters, num_projects)
+    """
+    project_idx = {project: j for j, project in enumerate(projects)}
+    rows, cols = [], []
+    for i, voter in enumerate(profile):
+        for project in voter.approved:
+            j = project_idx.get(project)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+
+    matrix = np.zeros((len(profile), len(project_idx)), dtype=bool)
+    matrix[rows, cols] = True
+    return matrix
+
+
+def as_float_array(values) -> np.ndarray:
+    """
+    Convert values to a float64 array if they are all plain ints/floats.
+    
+    Used to decide whether the compiled (numba) kernels can be used: exact
+    rationals such as gmpy2 mpq would lose precision, so they are rejected.
+    
+    Args:
+        values: Sequence of numbers
+        
+    Returns:
+        float64 array, or None if any value is not a plain int/float
+    """
+    if all(isinstance(v, (int, float)) for v in values):
+        return np.asarray(values, dtype=np.float64)
+    return None
@@ -4,17 +4,14 @@ Run Exact Equal Shares with add1 completion (approval utilities, exhaustive).
 Continues until all projects are selected (does not stop on overspend).
 """
 
-from pabutools.election import parse_pabulib
-import pandas as pd
-import copy
 from pathlib import Path
 import os
 import sys
 
-from core.utils import profile_preprocessing
-from core.ees import exact_method_of_equal_shares_approval_add_one, create_ees_results_df
+from core.cache import load_instance_cached
+from core.ees import exact_method_of_equal_shares_approval_add_one, create_ees_results_row
 from core.add_opt import add_opt_approval
-from core.cli import setup_results_dir, save_results
+from core.cli import setup_results_dir, save_results_dict
 
 
 def exact_method_of_equal_shares_with_completion_approval(pabulib_file: str, budget: int = 0):
@@ -23,8 +20,7 @@ def exact_method_of_equal_shares_with_completion_approval(pabulib_file: str, bud
     
     Continues until all projects are selected (does not stop on overspend).
     """
-    instance, profile = parse_pabulib(pabulib_file)
-    profile = profile_preprocessing(profile)
+    instance, profile = load_instance_cached(pabulib_file)
 
     initial_budget = instance.budget_limit
     if budget > 0:
@@ -38,7 +34,7 @@ def exact_method_of_equal_shares_with_completion_approval(pabulib_file: str, bud
     efficiency = total_cost / initial_budget
 
 
-    return create_ees_results_df(
+    return create_ees_results_row(
         result = selected_projects,
         efficiency = efficiency,
         budget_increase_count=increase_counter
@@ -66,8 +62,8 @@ if __name__ == "__main__":
         print(f"Processing file: {input_path}")
         print(f"Results will be saved to: {output_path}")
         
-        output_df = exact_method_of_equal_shares_with_completion_approval(str(input_path))
-        save_results(output_df, results_dir, output_filename)
+        output_row = exact_method_of_equal_shares_with_completion_approval(str(input_path))
+        save_results_dict(output_row, results_dir, output_filename)
         
     except Exception as e:
         print(f"Error during execution: {str(e)}")
@@ -6,16 +6,15 @@ Single MES run without any budget increases.
 
 from pabutools.election import parse_pabulib, Cardinality_Sat
 from pabutools.rules import method_of_equal_shares
-import pandas as pd
 import os
 from pathlib import Path
 import sys
 
-from core.mes import create_mes_results_df, calculate_efficiency
-from core.cli import setup_results_dir, save_results
+from core.mes import create_mes_results_row, calculate_efficiency
+from core.cli import setup_results_dir, save_results_dict
 
 
-def run_mes_no_completion(pabulib_file: str, budget: int = 0) -> pd.DataFrame:
+def run_mes_no_completion(pabulib_file: str, budget: int = 0) -> dict:
     """
     Run MES without completion (approval utilities).
     
@@ -23,13 +22,8 @@ def run_mes_no_completion(pabulib_file: str, budget: int = 0) -> pd.DataFrame:
     """
     instance, profile = parse_pabulib(pabulib_file)
     
-    if budget > 0:
-        initial_budget = int(budget)
-        instance.budget_limit = int(budget)
-    else:
-        initial_budget = int(instance.budget_limit)
-
-    instance.budget_limit = int(instance.budget_limit)
+    initial_budget = int(budget) if budget > 0 else int(instance.budget_limit)
+    instance.budget_limit = initial_budget
 
     result = method_of_equal_shares(
         instance=instance,
@@ -40,7 +34,7 @@ def run_mes_no_completion(pabulib_file: str, budget: int = 0) -> pd.DataFrame:
     total_cost = sum(p.cost for p in result)
     efficiency = total_cost / initial_budget if initial_budget > 0 else 0.0
 
-    return create_mes_results_df(
+    return create_mes_results_row(
         result=result,
         efficiency=efficiency,
         budget_increase_count=0,
@@ -67,8 +61,8 @@ if __name__ == "__main__":
         print(f"Processing file: {input_path}")
         print(f"Results will be saved to: {results_dir / output_filename}")
         
-        output_df = run_mes_no_completion(str(input_path))
-        save_results(output_df, results_dir, output_filename)
+        output_row = run_mes_no_completion(str(input_path))
+        save_results_dict(output_row, results_dir, output_filename)
         
     except Exception as e:
         print(f"Error during execution: {str(e)}")
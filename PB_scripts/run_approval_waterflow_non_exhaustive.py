@@ -5,16 +5,15 @@ Uses incremental budget increases until cost exceeds initial budget.
 """
 
 from pabutools.election import parse_pabulib, Cardinality_Sat
-import pandas as pd
 import os
 from pathlib import Path
 import sys
 
-from core.mes import mes_with_budget_increase_exhaustion, create_mes_results_df
-from core.cli import setup_results_dir, save_results
+from core.mes import mes_with_budget_increase_exhaustion, create_mes_results_row
+from core.cli import setup_results_dir, save_results_dict
 
 
-def run_mes_with_exhaustion(pabulib_file: str, budget: int = 0) -> pd.DataFrame:
+def run_mes_with_exhaustion(pabulib_file: str, budget: int = 0) -> dict:
     """
     Run MES with budget exhaustion (non-exhaustive, approval utilities).
     
@@ -22,13 +21,8 @@ def run_mes_with_exhaustion(pabulib_file: str, budget: int = 0) -> pd.DataFrame:
     """
     instance, profile = parse_pabulib(pabulib_file)
     
-    if budget > 0:
-        initial_budget = int(budget)
-        instance.budget_limit = int(budget)
-    else:
-        initial_budget = int(instance.budget_limit)
-
-    instance.budget_limit = int(instance.budget_limit)
+    initial_budget = int(budget) if budget > 0 else int(instance.budget_limit)
+    instance.budget_limit = initial_budget
 
     result, efficiency, increase_counter = mes_with_budget_increase_exhaustion(
         instance, profile,
@@ -36,7 +30,7 @@ def run_mes_with_exhaustion(pabulib_file: str, budget: int = 0) -> pd.DataFrame:
         stop_on_overspend=True,
     )
 
-    return create_mes_results_df(
+    return create_mes_results_row(
         result=result,
         efficiency=efficiency,
         budget_increase_count=increase_counter,
@@ -63,8 +57,8 @@ if __name__ == "__main__":
         print(f"Processing file: {input_path}")
         print(f"Results will be saved to: {results_dir / output_filename}")
         
-        output_df = run_mes_with_exhaustion(str(input_path))
-        save_results(output_df, results_dir, output_filename)
+        output_row = run_mes_with_exhaustion(str(input_path))
+        save_results_dict(output_row, results_dir, output_filename)
         
     except Exception as e:
         print(f"Error during execution: {str(e)}")
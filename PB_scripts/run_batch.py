@@ -0,0 +1,186 @@
+"""
+Run one of the run_*.py experiments over many pabulib files in parallel.
+
+Each file is processed independently by a worker process, which calls the
+script's entry function and writes its CSV to the script's usual results
+directory.
+
+Usage:
+    python run_batch.py <script> <directory_or_glob> [--jobs N]
+
+Example:
+    python run_batch.py run_approval_equal_shares ../data/poland
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import glob
+import importlib
+import os
+import sys
+
+from core.cli import setup_results_dir, save_results_dict, get_pabulib_files
+
+
+# Script module -> (entry function, results subdirectory)
+SCRIPTS = {
+    "run_approval_equal_shares": (
+        "exact_method_of_equal_shares_with_completion_approval",
+        "exact_equal_shares/approval/non_exhaustive",
+    ),
+    "run_approval_equal_shares_addone_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_approval",
+        "exact_equal_shares/approval/addone_exhaustive",
+    ),
+    "run_approval_equal_shares_addone_non_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_approval",
+        "exact_equal_shares/approval/addone_non_exhaustive",
+    ),
+    "run_approval_equal_shares_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_approval_exhaustive",
+        "exact_equal_shares/approval/exhaustive",
+    ),
+    "run_approval_equal_shares_exhaustive_heuristic": (
+        "exact_method_of_equal_shares_with_completion_approval_exhaustive_heuristic",
+        "exact_equal_shares/approval/exhaustive_heuristic",
+    ),
+    "run_approval_equal_shares_no_completion": (
+        "exact_method_of_equal_shares_with_completion_approval",
+        "exact_equal_shares/approval/no_completion",
+    ),
+    "run_approval_equal_shares_non_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_approval",
+        "exact_equal_shares/approval/non_exhaustive",
+    ),
+    "run_approval_equal_shares_non_exhaustive_heuristic": (
+        "exact_method_of_equal_shares_with_completion_approval_heuristic",
+        "exact_equal_shares/approval/non_exhaustive_heuristic",
+    ),
+    "run_approval_waterflow_exhaustive": (
+        "run_mes_exhaustive",
+        "waterflow_equal_shares/approval/exhaustive",
+    ),
+    "run_approval_waterflow_no_completion": (
+        "run_mes_no_completion",
+        "waterflow_equal_shares/approval/no_completion",
+    ),
+    "run_approval_waterflow_non_exhaustive": (
+        "run_mes_with_exhaustion",
+        "waterflow_equal_shares/approval/non_exhaustive",
+    ),
+    "run_cost_equal_shares_addone_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_cost",
+        "exact_equal_shares/cost/addone_exhaustive",
+    ),
+    "run_cost_equal_shares_addone_non_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_cost",
+        "exact_equal_shares/cost/addone_non_exhaustive",
+    ),
+    "run_cost_equal_shares_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_cost_exhaustive",
+        "exact_equal_shares/cost/exhaustive",
+    ),
+    "run_cost_equal_shares_exhaustive_heuristic": (
+        "exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic",
+        "exact_equal_shares/cost/exhaustive_heuristic",
+    ),
+    "run_cost_equal_shares_no_completion": (
+        "exact_method_of_equal_shares_with_completion_cost",
+        "exact_equal_shares/cost/no_completion",
+    ),
+    "run_cost_equal_shares_non_exhaustive": (
+        "exact_method_of_equal_shares_with_completion_cost",
+        "exact_equal_shares/cost/non_exhaustive",
+    ),
+    "run_cost_equal_shares_non_exhaustive_heuristic": (
+        "exact_method_of_equal_shares_with_completion_cost_heuristic",
+        "exact_equal_shares/cost/non_exhaustive_heuristic",
+    ),
+    "run_cost_waterflow_exhaustive": (
+        "run_mes_exhaustive",
+        "waterflow_equal_shares/cost/exhaustive",
+    ),
+    "run_cost_waterflow_no_completion": (
+        "run_mes_no_completion",
+        "waterflow_equal_shares/cost/no_completion",
+    ),
+    "run_cost_waterflow_non_exhaustive": (
+        "run_mes_with_exhaustion",
+        "waterflow_equal_shares/cost/non_exhaustive",
+    ),
+}
+
+
+def collect_input_files(source: str) -> list:
+    """
+    Resolve a directory (all .pb files in it) or a glob pattern to a sorted file list.
+    """
+    path = Path(source)
+    if path.is_dir():
+        return [p.resolve() for p in get_pabulib_files(path)]
+    return sorted(Path(p).resolve() for p in glob.glob(source))
+
+
+def run_single_file(script: str, pabulib_file: str) -> Path:
+    """
+    Run a script's entry function on one file and save its results CSV.
+
+    Executed in a worker process; the script module is imported there, so
+    nothing but the two strings has to be pickled.
+
+    Returns:
+        Path of the written CSV
+    """
+    func_name, results_subdir = SCRIPTS[script]
+    experiment_func = getattr(importlib.import_module(script), func_name)
+
+    input_path = Path(pabulib_file)
+    results_dir = setup_results_dir(results_subdir)
+    output_filename = f"{input_path.stem}.csv"
+
+    output_row = experiment_func(str(input_path))
+    save_results_dict(output_row, results_dir, output_filename)
+    return results_dir / output_filename
+
+
+def run_batch(script: str, files: list, max_workers: int = None) -> int:
+    """
+    Process files in parallel, printing progress as each one finishes.
+
+    Returns:
+        Number of files that failed
+    """
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_single_file, script, str(pabulib_file)): pabulib_file
+            for pabulib_file in files
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            pabulib_file = futures[future]
+            try:
+                output_path = future.result()
+                print(f"[{done}/{len(files)}] {pabulib_file.name} -> {output_path}")
+            except Exception as e:
+                failures += 1
+                print(f"[{done}/{len(files)}] {pabulib_file.name} failed: {str(e)}")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a PB experiment over many files in parallel")
+    parser.add_argument("script", choices=sorted(SCRIPTS), help="Experiment script to run")
+    parser.add_argument("source", type=str, help="Directory of .pb files or a glob pattern")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    files = collect_input_files(args.source)
+    if not files:
+        print(f"Error: No pabulib files found for {args.source}.")
+        sys.exit(1)
+
+    print(f"Processing {len(files)} files with {args.jobs} workers")
+    failures = run_batch(args.script, files, max_workers=args.jobs)
+    sys.exit(1 if failures else 0)
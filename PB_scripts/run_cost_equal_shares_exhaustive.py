@@ -4,17 +4,15 @@ Run Exact Equal Shares with completion (cost/uniform utilities, exhaustive).
 Uses ADD-OPT and continues until all projects are selected.
 """
 
-from pabutools.election import parse_pabulib
-import pandas as pd
-import copy
 from pathlib import Path
 import os
 import sys
 
-from core.utils import profile_preprocessing, cost_utility
-from core.ees import exact_method_of_equal_shares_cost
+from core.cache import load_instance_cached
+from core.utils import cost_utility
+from core.ees import exact_method_of_equal_shares_cost, prepare_ees_setup
 from core.add_opt import add_opt_cost
-from core.cli import setup_results_dir, save_results
+from core.cli import setup_results_dir, save_results_dict
 
 
 def exact_method_of_equal_shares_with_completion_cost_exhaustive(pabulib_file: str, budget: int = 0):
@@ -23,19 +21,20 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive(pabulib_file: s
     
     Continues until all projects are selected.
     """
-    instance, profile = parse_pabulib(pabulib_file)
-    profile = profile_preprocessing(profile)
+    instance, profile = load_instance_cached(pabulib_file)
+    # Budget-independent EES data, shared by every run below
+    ees_setup = prepare_ees_setup(instance, profile, cost_utility)
+    n_voters = len(profile)
     number_total_projects = len(instance)
 
     initial_budget = instance.budget_limit
-    if budget > 0:
-        instance.budget_limit = budget
+    current_budget = budget if budget > 0 else initial_budget
 
     selected_projects_with_bpb, payments, shares, total_cost = exact_method_of_equal_shares_cost(
-        instance, profile
+        instance, profile, budget=current_budget, setup=ees_setup
     )
     
-    most_efficient_project_set = copy.deepcopy(selected_projects_with_bpb)
+    most_efficient_project_set = selected_projects_with_bpb.copy()
     budget_increase_count = 0
     budget_increase_list = []
     efficiency_tracker = total_cost / initial_budget
@@ -43,7 +42,7 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive(pabulib_file: s
     exceeded_non_exhaustive_case = 0
 
     prev_total_cost = total_cost
-    prev_project_set = copy.deepcopy(selected_projects_with_bpb)
+    prev_project_set = selected_projects_with_bpb.copy()
     final_efficiency = 0
 
     while True:
@@ -55,17 +54,17 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive(pabulib_file: s
             break
 
         budget_increase_count += 1
-        instance.budget_limit += min_budget_increase * len(profile)
+        current_budget += min_budget_increase * n_voters
 
         selected_projects_with_bpb, payments, shares, total_cost = exact_method_of_equal_shares_cost(
-            instance, profile
+            instance, profile, budget=current_budget, setup=ees_setup
         )
 
         if total_cost > initial_budget:
             exceeded_non_exhaustive_case = 1
         else:
             budget_increase_list.append(min_budget_increase)
-            prev_project_set = copy.deepcopy(selected_projects_with_bpb)
+            prev_project_set = selected_projects_with_bpb.copy()
             prev_total_cost = total_cost
             
             efficiency_candidate = total_cost / initial_budget
@@ -73,7 +72,7 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive(pabulib_file: s
                 if exceeded_non_exhaustive_case:
                     monotonic_violation = 1
                 efficiency_tracker = efficiency_candidate
-                most_efficient_project_set = copy.deepcopy(selected_projects_with_bpb)
+                most_efficient_project_set = selected_projects_with_bpb.copy()
 
         # Check project count (handle both dict and list)
         project_count = len(selected_projects_with_bpb) if isinstance(selected_projects_with_bpb, (list, dict)) else 0
@@ -81,20 +80,20 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive(pabulib_file: s
             final_efficiency = prev_total_cost / initial_budget
             break
 
-    data = {
-        'most_efficient_project_set': [most_efficient_project_set],
-        'highest_efficiency_attained': [efficiency_tracker],
-        'final_project_set': [prev_project_set],
-        'final_efficiency': [final_efficiency],
-        'budget_increase_count': [budget_increase_count],
-        'len_budget_increase_list': [len(budget_increase_list)],
-        'max_budget_increase': [max(budget_increase_list)] if budget_increase_list else [0],
-        'min_budget_increase': [min(budget_increase_list)] if budget_increase_list else [0],
-        'avg_budget_increase': [sum(budget_increase_list)/len(budget_increase_list)] if budget_increase_list else [0],
-        'monotonic_violation': [monotonic_violation]
+    row = {
+        'most_efficient_project_set': most_efficient_project_set,
+        'highest_efficiency_attained': efficiency_tracker,
+        'final_project_set': prev_project_set,
+        'final_efficiency': final_efficiency,
+        'budget_increase_count': budget_increase_count,
+        'len_budget_increase_list': len(budget_increase_list),
+        'max_budget_increase': max(budget_increase_list) if budget_increase_list else 0,
+        'min_budget_increase': min(budget_increase_list) if budget_increase_list else 0,
+        'avg_budget_increase': sum(budget_increase_list)/len(budget_increase_list) if budget_increase_list else 0,
+        'monotonic_violation': monotonic_violation
     }
 
-    return pd.DataFrame(data)
+    return row
 
 
 if __name__ == "__main__":
@@ -118,8 +117,8 @@ if __name__ == "__main__":
         print(f"Processing file: {input_path}")
         print(f"Results will be saved to: {output_path}")
         
-        output_df = exact_method_of_equal_shares_with_completion_cost_exhaustive(str(input_path))
-        save_results(output_df, results_dir, output_filename)
+        output_row = exact_method_of_equal_shares_with_completion_cost_exhaustive(str(input_path))
+        save_results_dict(output_row, results_dir, output_filename)
         
     except Exception as e:
         print(f"Error during execution: {str(e)}")
@@ -4,17 +4,15 @@ Run Exact Equal Shares with completion (cost/uniform utilities, exhaustive, heur
 Uses ADD-OPT-SKIP and continues until all projects are selected.
 """
 
-from pabutools.election import parse_pabulib
-import pandas as pd
-import copy
 from pathlib import Path
 import os
 import sys
 
-from core.utils import profile_preprocessing, cost_utility
-from core.ees import exact_method_of_equal_shares_cost
+from core.cache import load_instance_cached
+from core.utils import cost_utility
+from core.ees import exact_method_of_equal_shares_cost, prepare_ees_setup
 from core.add_opt import add_opt_cost_heuristic
-from core.cli import setup_results_dir, save_results
+from core.cli import setup_results_dir, save_results_dict
 
 
 def exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(pabulib_file: str, budget: int = 0):
@@ -23,30 +21,35 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(pabul
     
     Continues until all projects are selected.
     """
-    instance, profile = parse_pabulib(pabulib_file)
-    profile = profile_preprocessing(profile)
+    instance, profile = load_instance_cached(pabulib_file)
+    # Budget-independent EES data, shared by every run below
+    ees_setup = prepare_ees_setup(instance, profile, cost_utility)
+    n_voters = len(profile)
     number_total_projects = len(instance)
 
     initial_budget = instance.budget_limit
-    if budget > 0:
-        instance.budget_limit = budget
+    current_budget = budget if budget > 0 else initial_budget
 
     selected_projects_with_bpb, payments, shares, total_cost = exact_method_of_equal_shares_cost(
-        instance, profile
+        instance, profile, budget=current_budget, setup=ees_setup
     )
     
-    most_efficient_project_set = copy.deepcopy(selected_projects_with_bpb)
+    most_efficient_project_set = selected_projects_with_bpb.copy()
     budget_increase_count = 0
-    budget_increase_list = []
+    # Running statistics of the accepted budget increases
+    bi_min = bi_max = None
+    bi_sum = 0
+    bi_count = 0
     efficiency_tracker = total_cost / initial_budget
     monotonic_violation = 0
     exceeded_non_exhaustive_case = 0
 
     prev_total_cost = total_cost
-    prev_project_set = copy.deepcopy(selected_projects_with_bpb)
+    prev_project_set = selected_projects_with_bpb.copy()
     final_efficiency = 0
 
-    while True:
+    # ADD-OPT-SKIP has nothing to consider once every project is selected
+    while len(selected_projects_with_bpb) < number_total_projects:
         min_budget_increase = add_opt_cost_heuristic(
             instance, profile, selected_projects_with_bpb, payments, shares
         )
@@ -55,17 +58,22 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(pabul
             break
 
         budget_increase_count += 1
-        instance.budget_limit += min_budget_increase * len(profile)
+        current_budget += min_budget_increase * n_voters
 
         selected_projects_with_bpb, payments, shares, total_cost = exact_method_of_equal_shares_cost(
-            instance, profile
+            instance, profile, budget=current_budget, setup=ees_setup
         )
 
         if total_cost > initial_budget:
             exceeded_non_exhaustive_case = 1
         else:
-            budget_increase_list.append(min_budget_increase)
-            prev_project_set = copy.deepcopy(selected_projects_with_bpb)
+            if bi_count == 0 or min_budget_increase < bi_min:
+                bi_min = min_budget_increase
+            if bi_count == 0 or min_budget_increase > bi_max:
+                bi_max = min_budget_increase
+            bi_sum += min_budget_increase
+            bi_count += 1
+            prev_project_set = selected_projects_with_bpb.copy()
             prev_total_cost = total_cost
             
             efficiency_candidate = total_cost / initial_budget
@@ -73,7 +81,7 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(pabul
                 if exceeded_non_exhaustive_case:
                     monotonic_violation = 1
                 efficiency_tracker = efficiency_candidate
-                most_efficient_project_set = copy.deepcopy(selected_projects_with_bpb)
+                most_efficient_project_set = selected_projects_with_bpb.copy()
 
         # Check project count (handle both dict and list)
         project_count = len(selected_projects_with_bpb) if isinstance(selected_projects_with_bpb, (list, dict)) else 0
@@ -81,20 +89,20 @@ def exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(pabul
             final_efficiency = prev_total_cost / initial_budget
             break
 
-    data = {
-        'most_efficient_project_set': [most_efficient_project_set],
-        'highest_efficiency_attained': [efficiency_tracker],
-        'final_project_set': [prev_project_set],
-        'final_efficiency': [final_efficiency],
-        'budget_increase_count': [budget_increase_count],
-        'len_budget_increase_list': [len(budget_increase_list)],
-        'max_budget_increase': [max(budget_increase_list)] if budget_increase_list else [0],
-        'min_budget_increase': [min(budget_increase_list)] if budget_increase_list else [0],
-        'avg_budget_increase': [sum(budget_increase_list)/len(budget_increase_list)] if budget_increase_list else [0],
-        'monotonic_violation': [monotonic_violation]
+    row = {
+        'most_efficient_project_set': most_efficient_project_set,
+        'highest_efficiency_attained': efficiency_tracker,
+        'final_project_set': prev_project_set,
+        'final_efficiency': final_efficiency,
+        'budget_increase_count': budget_increase_count,
+        'len_budget_increase_list': bi_count,
+        'max_budget_increase': bi_max if bi_count else 0,
+        'min_budget_increase': bi_min if bi_count else 0,
+        'avg_budget_increase': bi_sum / bi_count if bi_count else 0,
+        'monotonic_violation': monotonic_violation
     }
 
-    return pd.DataFrame(data)
+    return row
 
 
 if __name__ == "__main__":
@@ -118,8 +126,8 @@ if __name__ == "__main__":
         print(f"Processing file: {input_path}")
         print(f"Results will be saved to: {output_path}")
         
-        output_df = exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(str(input_path))
-        save_results(output_df, results_dir, output_filename)
+        output_row = exact_method_of_equal_shares_with_completion_cost_exhaustive_heuristic(str(input_path))
+        save_results_dict(output_row, results_dir, output_filename)
         
     except Exception as e:
         print(f"Error during execution: {str(e)}")
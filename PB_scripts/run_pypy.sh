@@ -0,0 +1,25 @@
+#!/bin/bash
+
+# Run one of the run_*.py experiment scripts under PyPy when it is available.
+#
+# Usage: sh run_pypy.sh <run_script.py> <pabulib_file>
+#
+# Set PYPY to choose the interpreter (default: pypy3 on the PATH). If it is
+# missing, is not actually PyPy, or lacks pabutools/numpy, the script runs
+# under the regular python instead. pandas is not needed: the scripts write
+# their results with the csv module, and numba is optional.
+
+PYPY="${PYPY:-pypy3}"
+
+if command -v "$PYPY" > /dev/null 2>&1 && "$PYPY" -c "
+import sys
+assert sys.implementation.name == 'pypy'
+import pabutools, numpy
+" > /dev/null 2>&1; then
+    INTERPRETER="$PYPY"
+else
+    echo "PyPy with pabutools and numpy not found ($PYPY), using python"
+    INTERPRETER="python"
+fi
+
+exec "$INTERPRETER" "$@"
@@ -9,7 +9,10 @@ such that EES(E(b + n*d)) ≠ (W, X).
 This algorithm runs in O(m²n) time.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+from functools import partial
 from typing import Callable, Optional
 
 from .types import Election, EESOutcome, Project
@@ -20,6 +23,7 @@ def add_opt_uniform(
     election: Election,
     outcome: EESOutcome,
     utility: Callable[[Project], Fraction],
+    n_jobs: Optional[int] = 1,
 ) -> Optional[Fraction]:
     """
     Algorithm 5: ADD-OPT for uniform utilities.
@@ -30,6 +34,10 @@ def add_opt_uniform(
         election: The election E(b)
         outcome: The EES outcome (W, X) for E(b) with utility u
         utility: The uniform utility function u(p)
+        n_jobs: Number of worker processes for the per-project GPC calls
+            (None, 0 or 1 runs them in-process, -1 uses all cores). The
+            calls are independent; with workers, utility must be picklable
+            (a module-level function such as cost_utility).
         
     Returns:
         The minimum d value, or None if outcome is stable for all budgets (infinity).
@@ -37,12 +45,25 @@ def add_opt_uniform(
     # Precompute L lists
     L_lists = compute_L_lists(election, outcome, utility)
     
+    gpc = partial(
+        greedy_project_change_uniform, election, outcome, utility=utility, L_lists=L_lists
+    )
+    if n_jobs is not None and n_jobs < -1:
+        raise ValueError(f"n_jobs must be -1 (all cores) or at least 0, got {n_jobs}")
+
+    project_ids = list(election.projects)
+    if n_jobs in (None, 0, 1) or len(project_ids) < 2:
+        gpc_values = [gpc(project_id) for project_id in project_ids]
+    else:
+        # The shared inputs are pickled once per chunk of projects
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        chunksize = -(-len(project_ids) // max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            gpc_values = list(executor.map(gpc, project_ids, chunksize=chunksize))
+    
     d: Optional[Fraction] = None  # None means infinity
     
-    for project_id in election.projects:
-        gpc_d = greedy_project_change_uniform(
-            election, outcome, project_id, utility, L_lists
-        )
+    for gpc_d in gpc_values:
         if gpc_d is not None and gpc_d > 0:
             if d is None or gpc_d < d:
                 d = gpc_d
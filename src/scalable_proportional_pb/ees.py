@@ -10,7 +10,7 @@ EES selects projects by highest bang-per-buck, where:
 """
 
 from fractions import Fraction
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from collections import OrderedDict
 
 from .types import Election, EESOutcome, Project
@@ -69,7 +69,7 @@ def ees_with_outcome(
     total_cost = Fraction(0)
     
     # Precompute supporters for each project
-    supporters: Dict[str, Set[int]] = {
+    supporters: Dict[str, FrozenSet[int]] = {
         p_id: election.project_supporters(p_id)
         for p_id in election.projects
     }
@@ -10,8 +10,10 @@ budget increase d such that project p certifies instability.
 This algorithm runs in O(m + n) time.
 """
 
+import math
 from fractions import Fraction
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from .types import Election, EESOutcome, Project
 
@@ -33,7 +35,8 @@ def greedy_project_change_uniform(
         election: The election E(b)
         outcome: A stable EES outcome (W, X) for E(b)
         project_id: The project p to consider
-        utility: The uniform utility function u(p)
+        utility: The uniform utility function u(p); every supporter of p
+            gets the same utility, so it is evaluated once per call
         L_lists: Precomputed L_1, ..., L_{w+1} lists (see compute_L_lists)
         
     Returns:
@@ -57,23 +60,46 @@ def greedy_project_change_uniform(
     if not O_p_X:
         return None  # Infinity
     
-    # Get selection order with BpB values
-    selection_order = outcome.selection_order
-    w = len(selection_order)
+    # p_1, ..., p_w and their BpB values as two parallel lists
+    selection_ids = [p_id for p_id, _ in outcome.selection_order]
+    selection_bpbs = [bpb for _, bpb in outcome.selection_order]
     
-    # Compute BpB for project p if it were to be funded by t voters
-    def bpb_for_t(t: int) -> Fraction:
-        if t == 0:
-            return Fraction(0)
-        return utility(project) * t / cost
+    return _gpc_scan(
+        selection_ids, selection_bpbs, L_lists, O_p_X, project_id, cost, utility(project),
+        len(N_p_X),
+    )
+
+
+def _gpc_scan(
+    selection_ids: List[str],
+    selection_bpbs: List[Fraction],
+    L_lists: List[List[Tuple[int, Fraction]]],
+    O_p_X: Set[int],
+    project_id: str,
+    cost: Fraction,
+    utility_p: Fraction,
+    N_p_X_count: int,
+) -> Optional[Fraction]:
+    """
+    The scalar loop of Algorithm 4 on precomputed inputs.
     
-    # Filter L lists to only include voters in O_p(X)
-    L_Op: List[List[Tuple[int, Fraction]]] = []
-    for L_i in L_lists:
-        filtered = [(v, val) for v, val in L_i if v in O_p_X]
-        filtered.sort(key=lambda x: x[1])
-        L_Op.append(filtered)
+    Takes only plain lists and numbers (no election/outcome lookups or
+    per-step callbacks), so every step is a few local indexing and
+    arithmetic operations.
     
+    Args:
+        selection_ids: The ids of p_1, ..., p_w
+        selection_bpbs: BpB(p_1), ..., BpB(p_w)
+        L_lists: L_1, ..., L_{w+1}, each listing every voter sorted by value
+        O_p_X: O_p(X), the supporters of p not paying for it
+        project_id: The project p (for tie-breaking)
+        cost: cost(p)
+        utility_p: u(p)
+        N_p_X_count: |N_p(X)|
+        
+    Returns:
+        The minimum d value, or None for infinity.
+    """
     # Paper Algorithm 4 (uniform utilities), reconstructed from the PDF:
     #
     #   d := +∞
@@ -87,37 +113,72 @@ def greedy_project_change_uniform(
     #   return d
     #
     # We implement it directly using:
-    # - `selection_order` = p1..pw in non-increasing (BpB, id) order
-    # - `i` as a 0-based list index into L_lists / L_Op, where paper i=w+1 is i=w
+    # - `selection_ids` / `selection_bpbs` = p1..pw in non-increasing (BpB, id) order
+    # - `i` as a 0-based list index into L_lists, where paper i=w+1 is i=w
     # - `L_i[|O|-ℓ]` as 0-based indexing (so ℓ=1 picks the last/richest element)
 
     d: Optional[Fraction] = None  # None means +∞
 
-    N_p_X_count = len(N_p_X)
     O_size = len(O_p_X)
 
+    def outranking_t(k: int) -> float:
+        """
+        Smallest t with (u(p)*t/cost(p), p) >_t (BpB(p_{k+1}), p_{k+1}).
+        
+        For u(p) > 0, u(p)*t/cost(p) > BpB <=> t > BpB*cost(p)/u(p), so the
+        tie-broken comparison becomes an integer bound on t (math.inf if p
+        never outranks p_{k+1}).
+        """
+        prev_bpb = selection_bpbs[k]
+        wins_tie = project_id > selection_ids[k]
+        if utility_p == 0:
+            # BpB of p is 0 whatever t is
+            return 0 if prev_bpb < 0 or (prev_bpb == 0 and wins_tie) else math.inf
+        bound = prev_bpb * cost / utility_p
+        return math.ceil(bound) if wins_tie else math.floor(bound) + 1
+
     # paper i starts at w+1; our 0-based index is w
-    i = w
+    i = len(selection_ids)
+    # t from which p outranks p_i (paper indexing), i.e. the current i can drop
+    next_t = outranking_t(i - 1) if i > 0 else math.inf
+
+    # The scan reads the ell-th richest member of O_p(X) in L_i, and while i
+    # stays the same ell only moves on by one. So instead of filtering each
+    # visited L_i into a new list, a single pointer walks the current L_i from
+    # its richest end, yielding the members of O_p(X) in turn; when i changes
+    # it restarts on the new L_i, skipping the ell - 1 richest members.
+    richest_first: Iterator[Tuple[int, Fraction]] = iter(())
+    pointer_i: Optional[int] = None
+
+    # Per-voter price cost(p)/t for t = |N_p(X)| + ell, ell = 1, ..., |O_p(X)|;
+    # the prices do not depend on i, so they are built in one pass up front
+    prices = [cost / t for t in range(N_p_X_count + 1, N_p_X_count + O_size + 1)]
 
-    for ell in range(1, O_size + 1):
+    for ell, PvP in enumerate(prices, start=1):
         t = N_p_X_count + ell
-        PvP = cost / t
-        current_bpb = bpb_for_t(t)
 
         # Maintain i as non-increasing as ell increases (paper Lemma 5.5).
-        # Decrease i while (current_bpb, p) outranks (prev_bpb, prev_id).
-        while i > 0:
-            prev_id, prev_bpb = selection_order[i - 1]
-            if (current_bpb > prev_bpb) or (current_bpb == prev_bpb and project_id > prev_id):
-                i -= 1
-            else:
-                break
-
-        idx = O_size - ell  # ell-th richest element
-        if i >= len(L_Op) or idx < 0 or idx >= len(L_Op[i]):
+        # Decrease i while p, funded by t voters, outranks (prev_bpb, prev_id).
+        # i only moves down, so each bound is computed once and most steps
+        # are a single integer comparison.
+        while t >= next_t:
+            i -= 1
+            next_t = outranking_t(i - 1) if i > 0 else math.inf
+
+        if i >= len(L_lists):
+            continue
+        if i != pointer_i:
+            # A hashed (frozen)set lookup is as fast as indexing a bytearray
+            # mask here, and several times faster than testing bits of an
+            # int bitmask, whose shifts copy O(n) bits each
+            members = (entry for entry in reversed(L_lists[i]) if entry[0] in O_p_X)
+            richest_first = islice(members, ell - 1, None)
+            pointer_i = i
+        entry = next(richest_first, None)  # ell-th richest element
+        if entry is None:
             continue
 
-        L_val = L_Op[i][idx][1]
+        L_val = entry[1]
         required = PvP - L_val
         if required > 0 and (d is None or required < d):
             d = required
@@ -149,29 +210,49 @@ def compute_L_lists(
         Each L[i] is a list of (voter_id, value) sorted by value.
     """
     selection_order = outcome.selection_order
-    w = len(selection_order)
     voters = election.voters
     
-    # L_{w+1} = leftover budgets
-    L_w_plus_1 = [(v, outcome.leftover_budgets[v]) for v in voters]
-    L_w_plus_1.sort(key=lambda x: x[1])
+    # Columns of values: leftover budgets r_v, then the payments to p_w, ..., p_1.
+    # Payments are sparse, so each project keeps only (position, amount)
+    # pairs for its payers; everyone else's entry is 0.
+    leftovers = [outcome.leftover_budgets[v] for v in voters]
+    position = election.voter_index()
+    payment_entries = [
+        [(position[v], outcome.payments[(v, proj_id)]) for v in outcome.project_payers(proj_id)]
+        for proj_id, _ in reversed(selection_order)
+    ]
     
-    # Build L lists from L_{w+1} back to L_1
-    L_lists: List[List[Tuple[int, Fraction]]] = [[] for _ in range(w + 1)]
-    L_lists[w] = L_w_plus_1
+    # Accumulate and sort exact integer numerators over a common denominator:
+    # integer additions and comparisons are far cheaper than Fraction ones
+    denominator = math.lcm(
+        *{x.denominator for x in leftovers},
+        *{amount.denominator for entries in payment_entries for _, amount in entries},
+    )
     
-    # Current values for each voter
-    current_vals = {v: outcome.leftover_budgets[v] for v in voters}
+    n = len(voters)
     
-    # Build L_w, L_{w-1}, ..., L_1
-    for k in range(w - 1, -1, -1):
-        proj_id, _ = selection_order[k]
-        # Add payment for project k to each voter's value
-        for v in voters:
-            current_vals[v] += outcome.payment(v, proj_id)
-        
-        L_k = [(v, current_vals[v]) for v in voters]
-        L_k.sort(key=lambda x: x[1])
-        L_lists[k] = L_k
+    def scaled(x: Fraction) -> int:
+        return x.numerator * (denominator // x.denominator)
+    
+    # Voters are ordered by the keys value * n + position, i.e. by value with
+    # ties broken by position in election order. Going from L_{k+1} to L_k
+    # only the payers of p_k move (up), so the keys are updated in place for
+    # them and the previous order is re-sorted: it is already sorted apart
+    # from the payers, which Timsort merges in far below O(n log n).
+    keys = [scaled(x) * n + j for j, x in enumerate(leftovers)]
+    order = sorted(range(n), key=keys.__getitem__)
+    
+    # (voter_id, value) entries of the current level by position. Voters who
+    # do not pay for p_k keep their value, so their tuple is shared with
+    # L_{k+1} and only the payers get a new tuple (and Fraction).
+    entries = list(zip(voters, leftovers))
+    L_lists: List[List[Tuple[int, Fraction]]] = [[entries[j] for j in order]]  # L_{w+1}
+    for payments in payment_entries:
+        for j, amount in payments:
+            keys[j] += scaled(amount) * n
+            entries[j] = (voters[j], Fraction(keys[j] // n, denominator))
+        order = sorted(order, key=keys.__getitem__)
+        L_lists.append([entries[j] for j in order])
+    L_lists.reverse()
     
     return L_lists
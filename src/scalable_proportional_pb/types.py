@@ -39,11 +39,21 @@ class Election:
         voters: list of voter ids (0-indexed integers for simplicity)
         approvals: dict mapping voter_id -> set of project ids they approve
         budget: total budget b
+    
+    The supporter sets and voter positions are indexed on first use, so
+    voters and approvals should not be modified after project_supporters or
+    voter_index has been called.
     """
     projects: Dict[str, Project]
     voters: List[int]
     approvals: Dict[int, Set[str]]  # voter_id -> set of approved project ids
     budget: Fraction
+    _supporters: Optional[Dict[str, FrozenSet[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _voter_index: Optional[Dict[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @property
     def n(self) -> int:
@@ -55,18 +65,34 @@ class Election:
         """Number of projects."""
         return len(self.projects)
     
-    def project_supporters(self, project_id: str) -> Set[int]:
+    def project_supporters(self, project_id: str) -> FrozenSet[int]:
         """Return set of voters who approve the given project."""
-        return {v for v in self.voters if project_id in self.approvals.get(v, set())}
+        if self._supporters is None:
+            supporters: Dict[str, Set[int]] = {}
+            for v in self.voters:
+                for p_id in self.approvals.get(v, ()):
+                    supporters.setdefault(p_id, set()).add(v)
+            self._supporters = {p_id: frozenset(vs) for p_id, vs in supporters.items()}
+        return self._supporters.get(project_id, frozenset())
+    
+    def voter_index(self) -> Dict[int, int]:
+        """Return the mapping voter_id -> position of the voter in voters."""
+        if self._voter_index is None:
+            self._voter_index = {v: j for j, v in enumerate(self.voters)}
+        return self._voter_index
     
     def with_budget(self, new_budget: Fraction) -> "Election":
         """Return a copy of this election with a different budget."""
-        return Election(
+        election = Election(
             projects=self.projects,
             voters=self.voters,
             approvals=self.approvals,
             budget=new_budget,
         )
+        # Same voters and approvals, so the indexes carry over
+        election._supporters = self._supporters
+        election._voter_index = self._voter_index
+        return election
 
 
 @dataclass
@@ -81,20 +107,32 @@ class EESOutcome:
     Also stores auxiliary info for ADD-OPT algorithms:
     - leftover_budgets: voter_id -> remaining budget r_i
     - selection_order: list of (project_id, bang_per_buck) in selection order
+    
+    The payer sets are indexed on first use, so payments should not be
+    modified after project_payers has been called.
     """
     selected: Set[str]  # project ids
     payments: Dict[Tuple[int, str], Fraction]  # (voter_id, project_id) -> payment
     leftover_budgets: Dict[int, Fraction]  # voter_id -> leftover budget
     selection_order: List[Tuple[str, Fraction]]  # (project_id, bpb) in order selected
     total_cost: Fraction
+    _payers: Optional[Dict[str, FrozenSet[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def payment(self, voter_id: int, project_id: str) -> Fraction:
         """Get payment from voter to project (0 if not paying)."""
         return self.payments.get((voter_id, project_id), Fraction(0))
     
-    def project_payers(self, project_id: str) -> Set[int]:
+    def project_payers(self, project_id: str) -> FrozenSet[int]:
         """Return set of voters paying for the given project."""
-        return {v for (v, p), amt in self.payments.items() if p == project_id and amt > 0}
+        if self._payers is None:
+            payers: Dict[str, Set[int]] = {}
+            for (v, p), amt in self.payments.items():
+                if amt > 0:
+                    payers.setdefault(p, set()).add(v)
+            self._payers = {p: frozenset(vs) for p, vs in payers.items()}
+        return self._payers.get(project_id, frozenset())
     
     def leximax_payment(self, voter_id: int) -> Tuple[Fraction, Optional[str]]:
         """
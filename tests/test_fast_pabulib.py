@@ -0,0 +1,120 @@
+"""
+Tests for the single-pass pabulib parser in PB_scripts/core/fast_pabulib.py.
+
+The scanner must return exactly what parse_pabulib followed by
+profile_preprocessing returns, both when it handles the file itself and
+when it falls back to pabutools.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+pytest.importorskip("pabutools")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "PB_scripts"))
+
+from pabutools.election import parse_pabulib
+
+from core import fast_pabulib
+from core.fast_pabulib import parse_pabulib_fast
+from core.utils import profile_preprocessing
+
+TEST_INSTANCE = Path(__file__).parent.parent / "PB_scripts" / "test_instance.pb"
+
+
+def parse_reference(path):
+    """Parse with pabutools, then preprocess the profile."""
+    instance, profile = parse_pabulib(str(path))
+    return instance, profile_preprocessing(profile)
+
+
+def assert_same_parse(fast, reference):
+    """Compare projects, costs, budget limit and every ballot."""
+    fast_instance, fast_profile = fast
+    ref_instance, ref_profile = reference
+
+    assert fast_instance.budget_limit == ref_instance.budget_limit
+    assert sorted((p.name, p.cost) for p in fast_instance) == sorted(
+        (p.name, p.cost) for p in ref_instance
+    )
+    assert fast_instance.meta == ref_instance.meta
+    assert fast_instance.file_name == ref_instance.file_name
+
+    assert len(fast_profile) == len(ref_profile)
+    for fast_voter, ref_voter in zip(fast_profile, ref_profile):
+        assert fast_voter.name == ref_voter.name
+        assert {p.name for p in fast_voter.approved} == {p.name for p in ref_voter.approved}
+
+
+@pytest.fixture
+def fallback_calls(monkeypatch):
+    """Record the files that fall back to parse_pabulib."""
+    calls = []
+
+    def recording_parse_pabulib(path):
+        calls.append(path)
+        return parse_pabulib(path)
+
+    monkeypatch.setattr(fast_pabulib, "parse_pabulib", recording_parse_pabulib)
+    return calls
+
+
+def write_variant(tmp_path, name, transform):
+    """Write a transformed copy of the bundled test instance."""
+    path = tmp_path / name
+    path.write_bytes(transform(TEST_INSTANCE.read_bytes()))
+    return path
+
+
+class TestFastParserMatchesPabutools:
+    """The scanner's own path agrees with parse_pabulib."""
+
+    def test_test_instance(self, fallback_calls):
+        """The bundled approval instance is parsed by the scanner itself."""
+        assert_same_parse(parse_pabulib_fast(str(TEST_INSTANCE)), parse_reference(TEST_INSTANCE))
+        assert fallback_calls == []
+
+    def test_voters_numbered_from_one(self):
+        """Voters get consecutive 1-based names, as in profile_preprocessing."""
+        _, profile = parse_pabulib_fast(str(TEST_INSTANCE))
+        assert [voter.name for voter in profile] == list(range(1, len(profile) + 1))
+
+    def test_crlf_line_endings(self, tmp_path):
+        """Windows line endings give the same instance and ballots."""
+        path = write_variant(tmp_path, "crlf.pb", lambda data: data.replace(b"\n", b"\r\n"))
+        assert_same_parse(parse_pabulib_fast(str(path)), parse_reference(path))
+
+
+class TestFastParserFallback:
+    """Files the scanner does not handle go through parse_pabulib."""
+
+    def test_non_approval_vote_type(self, tmp_path, fallback_calls):
+        """An ordinal election is parsed by pabutools."""
+        path = write_variant(
+            tmp_path, "ordinal.pb",
+            lambda data: data.replace(b"vote_type;approval", b"vote_type;ordinal"),
+        )
+        assert_same_parse(parse_pabulib_fast(str(path)), parse_reference(path))
+        assert fallback_calls == [str(path)]
+
+    def test_no_votes_section(self, tmp_path, fallback_calls):
+        """A file without a VOTES section is parsed by pabutools."""
+        path = write_variant(tmp_path, "no_votes.pb", lambda data: data[:data.index(b"VOTES")])
+        instance, profile = parse_pabulib_fast(str(path))
+        assert_same_parse((instance, profile), parse_reference(path))
+        assert profile == []
+        assert fallback_calls == [str(path)]
+
+    def test_quoted_fields(self, tmp_path, fallback_calls):
+        """Quoted VOTES fields are left to the csv-based parser."""
+        def quote_votes(data):
+            head, votes = data.split(b"VOTES", 1)
+            lines = votes.split(b"\n")
+            fields, vote = lines[2].rsplit(b";", 1)
+            lines[2] = fields + b';"' + vote + b'"'
+            return head + b"VOTES" + b"\n".join(lines)
+
+        path = write_variant(tmp_path, "quoted.pb", quote_votes)
+        assert_same_parse(parse_pabulib_fast(str(path)), parse_reference(path))
+        assert fallback_calls == [str(path)]
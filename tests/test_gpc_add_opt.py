@@ -316,3 +316,37 @@ class TestUniformUtility:
             # Should return a valid increment or infinity
             assert d >= 0
 
+    def test_add_opt_uniform_parallel_matches_serial(self):
+        """Spreading the GPC calls over worker processes gives the same d."""
+        e = make_election(
+            project_costs={"a": 10, "b": 20, "c": 30, "d": 25},
+            approvals={
+                0: ["a", "c"],
+                1: ["a", "b", "d"],
+                2: ["b", "c"],
+                3: ["c", "d"],
+            },
+            budget=40,
+        )
+        
+        outcome = ees_with_outcome(e, cost_utility)
+        
+        assert add_opt_uniform(e, outcome, cost_utility, n_jobs=2) == add_opt_uniform(
+            e, outcome, cost_utility
+        )
+
+    def test_add_opt_uniform_n_jobs_values(self):
+        """None and 0 run serially; counts below -1 are rejected."""
+        e = make_election(
+            project_costs={"a": 10, "b": 20},
+            approvals={0: ["a"], 1: ["a", "b"], 2: ["b"]},
+            budget=30,
+        )
+        
+        outcome = ees_with_outcome(e, cost_utility)
+        serial = add_opt_uniform(e, outcome, cost_utility)
+        
+        assert add_opt_uniform(e, outcome, cost_utility, n_jobs=None) == serial
+        assert add_opt_uniform(e, outcome, cost_utility, n_jobs=0) == serial
+        with pytest.raises(ValueError, match="n_jobs"):
+            add_opt_uniform(e, outcome, cost_utility, n_jobs=-2)
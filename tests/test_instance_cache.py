@@ -0,0 +1,213 @@
+"""
+Tests for the on-disk instance cache in PB_scripts/core/cache.py.
+"""
+
+import importlib
+import os
+import pickle
+import pytest
+import shutil
+import sys
+from pathlib import Path
+
+pytest.importorskip("pabutools")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "PB_scripts"))
+
+from pabutools.election import parse_pabulib
+
+from core import cache
+from core.utils import profile_preprocessing
+
+TEST_INSTANCE = Path(__file__).parent.parent / "PB_scripts" / "test_instance.pb"
+
+
+def summarize(instance, profile):
+    """Budget limit, project costs and ballots, for equality checks."""
+    return (
+        instance.budget_limit,
+        sorted((p.name, p.cost) for p in instance),
+        [(voter.name, sorted(p.name for p in voter.approved)) for voter in profile],
+    )
+
+
+@pytest.fixture
+def pb_file(tmp_path):
+    """A private copy of the test instance (its cache is written next to it)."""
+    path = tmp_path / "instance.pb"
+    shutil.copyfile(TEST_INSTANCE, path)
+    return path
+
+
+@pytest.fixture
+def cache_module(monkeypatch):
+    """Reload core.cache under the given environment, restoring it afterwards."""
+    for name in ("PB_CACHE", "PB_CACHE_DIR", "PB_FAST_PABULIB"):
+        monkeypatch.delenv(name, raising=False)
+
+    def reload(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return importlib.reload(cache)
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(cache)
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record which parser each cache miss uses."""
+    def spy(module):
+        calls = []
+        parse_slow, parse_fast = module.parse_pabulib, module.parse_pabulib_fast
+
+        def slow(path):
+            calls.append("parse_pabulib")
+            return parse_slow(path)
+
+        def fast(path):
+            calls.append("parse_pabulib_fast")
+            return parse_fast(path)
+
+        monkeypatch.setattr(module, "parse_pabulib", slow)
+        monkeypatch.setattr(module, "parse_pabulib_fast", fast)
+        return calls
+
+    return spy
+
+
+def cache_file_for(pb_file):
+    return pb_file.with_name(pb_file.name + cache.CACHE_SUFFIX)
+
+
+class TestCacheHitsAndMisses:
+    """Cache reuse and invalidation by (format, size, mtime)."""
+
+    def test_hit_returns_equal_instance(self, pb_file, cache_module, parse_calls):
+        module = cache_module()
+        calls = parse_calls(module)
+
+        first = module.load_instance_cached(str(pb_file))
+        assert cache_file_for(pb_file).exists()
+        second = module.load_instance_cached(str(pb_file))
+
+        assert calls == ["parse_pabulib"]
+        instance, profile = parse_pabulib(str(TEST_INSTANCE))
+        expected = summarize(instance, profile_preprocessing(profile))
+        assert summarize(*first) == expected
+        assert summarize(*second) == expected
+
+    def test_touch_forces_reparse(self, pb_file, cache_module, parse_calls):
+        module = cache_module()
+        calls = parse_calls(module)
+
+        module.load_instance_cached(str(pb_file))
+        stat = pb_file.stat()
+        os.utime(pb_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        module.load_instance_cached(str(pb_file))
+
+        assert calls == ["parse_pabulib", "parse_pabulib"]
+
+    def test_rewrite_forces_reparse(self, pb_file, cache_module):
+        module = cache_module()
+        instance, _ = module.load_instance_cached(str(pb_file))
+        assert instance.budget_limit == 447000
+
+        stat = pb_file.stat()
+        pb_file.write_bytes(pb_file.read_bytes().replace(b"budget;447000", b"budget;448000"))
+        # Same size; make sure the mtime moves even on coarse clocks
+        os.utime(pb_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        instance, _ = module.load_instance_cached(str(pb_file))
+        assert instance.budget_limit == 448000
+
+
+class TestCacheRecovery:
+    """Unusable cache files are rebuilt instead of raising."""
+
+    @pytest.mark.parametrize("contents", [b"", b"not a pickle", pickle.dumps("no tuple")[:-3]])
+    def test_corrupt_cache_rebuilt(self, pb_file, cache_module, contents):
+        module = cache_module()
+        cache_file_for(pb_file).write_bytes(contents)
+
+        instance, profile = module.load_instance_cached(str(pb_file))
+        assert instance.budget_limit == 447000
+        assert len(profile) == 1036
+
+        with open(cache_file_for(pb_file), "rb") as f:
+            signature, _, _ = pickle.load(f)
+        assert signature == module._source_signature(pb_file)
+
+    def test_outdated_format_rebuilt(self, pb_file, cache_module, parse_calls):
+        module = cache_module()
+        calls = parse_calls(module)
+        _, size, mtime_ns = module._source_signature(pb_file)
+        with open(cache_file_for(pb_file), "wb") as f:
+            pickle.dump(((module.CACHE_FORMAT - 1, size, mtime_ns), "stale", []), f)
+
+        instance, profile = module.load_instance_cached(str(pb_file))
+        assert calls == ["parse_pabulib"]
+        assert instance.budget_limit == 447000
+        assert len(profile) == 1036
+
+    def test_no_tmp_files_left_behind(self, pb_file, cache_module):
+        module = cache_module()
+        module.load_instance_cached(str(pb_file))
+        assert sorted(p.name for p in pb_file.parent.iterdir()) == [
+            pb_file.name, cache_file_for(pb_file).name,
+        ]
+
+
+class TestCacheSettings:
+    """Environment variables and arguments controlling the cache."""
+
+    def test_fast_parser_flag(self, pb_file, cache_module, parse_calls):
+        module = cache_module(PB_FAST_PABULIB="1")
+        calls = parse_calls(module)
+
+        instance, profile = module.load_instance_cached(str(pb_file))
+        assert calls == ["parse_pabulib_fast"]
+        reference, reference_profile = parse_pabulib(str(pb_file))
+        assert summarize(instance, profile) == summarize(
+            reference, profile_preprocessing(reference_profile)
+        )
+
+    def test_cache_disabled_by_env(self, pb_file, cache_module, parse_calls):
+        module = cache_module(PB_CACHE="0")
+        calls = parse_calls(module)
+
+        module.load_instance_cached(str(pb_file))
+        module.load_instance_cached(str(pb_file))
+        assert calls == ["parse_pabulib", "parse_pabulib"]
+        assert list(pb_file.parent.iterdir()) == [pb_file]
+
+    def test_cache_disabled_by_argument(self, pb_file, cache_module):
+        module = cache_module()
+        module.load_instance_cached(str(pb_file), use_cache=False)
+        assert list(pb_file.parent.iterdir()) == [pb_file]
+
+    def test_cache_dir_from_env(self, pb_file, tmp_path, cache_module, parse_calls):
+        cache_dir = tmp_path / "cache"
+        module = cache_module(PB_CACHE_DIR=str(cache_dir))
+        calls = parse_calls(module)
+
+        module.load_instance_cached(str(pb_file))
+        module.load_instance_cached(str(pb_file))
+        assert calls == ["parse_pabulib"]
+        assert not cache_file_for(pb_file).exists()
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_cache_dir_keeps_same_names_apart(self, tmp_path, cache_module):
+        module = cache_module()
+        cache_dir = tmp_path / "cache"
+        first = tmp_path / "a" / "instance.pb"
+        second = tmp_path / "b" / "instance.pb"
+        for path, budget in ((first, b"447000"), (second, b"500000")):
+            path.parent.mkdir()
+            path.write_bytes(TEST_INSTANCE.read_bytes().replace(b"budget;447000", b"budget;" + budget))
+
+        instance_a, _ = module.load_instance_cached(str(first), cache_dir=str(cache_dir))
+        instance_b, _ = module.load_instance_cached(str(second), cache_dir=str(cache_dir))
+        assert (instance_a.budget_limit, instance_b.budget_limit) == (447000, 500000)
+        assert len(list(cache_dir.iterdir())) == 2
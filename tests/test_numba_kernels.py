@@ -0,0 +1,218 @@
+"""
+Tests for the numba kernels in PB_scripts/core and their Python fallbacks.
+
+Each kernel is compiled when numba is installed and is otherwise a plain
+function; its .py_func is what exact (mpq) inputs always run. The kernel,
+its .py_func and the public function must agree on float and on mpq
+inputs. Costs are multiples of lcm(1..10) and shares are integers, so every
+price the algorithms compute is exact in floating point too.
+"""
+
+import random
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+pytest.importorskip("pabutools")
+gmpy2 = pytest.importorskip("gmpy2")
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "PB_scripts"))
+
+from pabutools.election import Instance, Project
+
+from core.add_opt import _greedy_inner, add_opt_approval, greedy_project_change_approvals
+from core.ees import _find_feasible_index, exact_method_of_equal_shares
+from core.utils import (
+    Voter,
+    _bang_per_buck_kernel,
+    build_payments_matrix,
+    calculate_bang_per_buck,
+    calculate_bang_per_buck_batch,
+    cardinal_utility,
+    cost_utility,
+)
+
+mpq = gmpy2.mpq
+
+# Divisible by every group size up to 10, so cost / group size is exact
+COST_UNIT = 2520
+SEEDS = range(50)
+
+
+def as_mpq_array(values):
+    return np.array([mpq(int(v)) for v in values], dtype=object)
+
+
+def random_election(rng, exact):
+    """
+    Random approval election with 6 voters.
+
+    exact=True gives mpq costs and budget (as parse_pabulib does), so EES
+    and ADD-OPT take the Python path; exact=False gives int costs and the
+    caller passes a float budget, which selects the compiled kernels.
+    """
+    n_projects = rng.randint(2, 6)
+    costs = [COST_UNIT * rng.randint(1, 6) for _ in range(n_projects)]
+    projects = [
+        Project(f"p{k}", mpq(cost) if exact else cost) for k, cost in enumerate(costs)
+    ]
+    budget = 6 * 10 * rng.randint(COST_UNIT // 30, COST_UNIT // 5)
+    instance = Instance(
+        projects,
+        budget_limit=mpq(budget) if exact else budget,
+        project_meta={project: {} for project in projects},
+    )
+    profile = [
+        Voter(name=v + 1, approved=frozenset(p for p in projects if rng.random() < 0.6))
+        for v in range(6)
+    ]
+    return instance, profile, budget
+
+
+class TestFindFeasibleIndex:
+    """ees._find_feasible_index against a linear scan."""
+
+    @staticmethod
+    def reference(shares, cost):
+        n = len(shares)
+        for i in range(n):
+            if cost / (n - i) <= shares[i]:
+                return i
+        return -1
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_float_and_mpq_agree(self, seed):
+        rng = random.Random(seed)
+        shares = sorted(rng.randint(0, 3 * COST_UNIT) for _ in range(rng.randint(1, 10)))
+        cost = COST_UNIT * rng.randint(1, 8)
+        expected = self.reference(shares, cost)
+
+        float_shares = np.array(shares, dtype=np.float64)
+        assert _find_feasible_index(float_shares, float(cost)) == expected
+        assert _find_feasible_index.py_func(float_shares, float(cost)) == expected
+        assert _find_feasible_index.py_func(as_mpq_array(shares), mpq(cost)) == expected
+
+
+class TestBangPerBuckBatch:
+    """utils._bang_per_buck_kernel and calculate_bang_per_buck_batch."""
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_float_and_mpq_agree(self, seed):
+        rng = random.Random(seed)
+        size = rng.randint(1, 8)
+        utilities = [rng.randint(1, 5) for _ in range(size)]
+        payers = [rng.randint(1, 10) for _ in range(size)]
+        costs = [COST_UNIT * rng.randint(1, 8) for _ in range(size)]
+
+        expected = [
+            calculate_bang_per_buck(Project("p", mpq(c)), n, lambda p, u=u: mpq(u))
+            for u, n, c in zip(utilities, payers, costs)
+        ]
+
+        float_args = [np.array(values, dtype=np.float64) for values in (utilities, payers, costs)]
+        for result in (
+            _bang_per_buck_kernel(*float_args),
+            _bang_per_buck_kernel.py_func(*float_args),
+            calculate_bang_per_buck_batch(*float_args),
+        ):
+            assert result.dtype == np.float64
+            assert result.tolist() == [float(value) for value in expected]
+
+        exact = calculate_bang_per_buck_batch(
+            as_mpq_array(utilities), np.array(payers, dtype=object), as_mpq_array(costs)
+        )
+        assert exact.tolist() == expected
+
+
+class TestGreedyInner:
+    """add_opt._greedy_inner and greedy_project_change_approvals."""
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_kernel_float_and_mpq_agree(self, seed):
+        rng = random.Random(seed)
+        size = rng.randint(1, 7)
+        leftovers = [rng.randint(0, COST_UNIT) for _ in range(size)]
+        max_payments = [rng.choice([0, COST_UNIT // 4, COST_UNIT // 2, COST_UNIT]) for _ in range(size)]
+        name_cmp = np.array([rng.choice([-1, 0, 1]) for _ in range(size)], dtype=np.int8)
+        num_paying = rng.randint(0, 3)
+        cost = COST_UNIT * rng.randint(1, 8)
+
+        sorted_leftovers = np.argsort(leftovers, kind="stable")
+        sorted_max_payments = np.argsort(max_payments, kind="stable")
+        float_args = (
+            sorted_leftovers, np.array(leftovers, dtype=np.float64),
+            sorted_max_payments, np.array(max_payments, dtype=np.float64),
+            name_cmp, float(cost), num_paying,
+        )
+        exact_args = (
+            sorted_leftovers, as_mpq_array(leftovers),
+            sorted_max_payments, as_mpq_array(max_payments),
+            name_cmp, mpq(cost), num_paying,
+        )
+
+        expected = _greedy_inner.py_func(*exact_args)
+        assert _greedy_inner(*float_args) == expected
+        assert _greedy_inner.py_func(*float_args) == expected
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_public_function_float_and_mpq_agree(self, seed):
+        rng = random.Random(seed)
+        exact_instance, exact_profile, budget = random_election(rng, exact=True)
+        float_instance, float_profile, _ = random_election(random.Random(seed), exact=False)
+
+        exact_selected, exact_payments, _, _ = exact_method_of_equal_shares(
+            exact_instance, exact_profile, cardinal_utility
+        )
+        float_selected, float_payments, _, _ = exact_method_of_equal_shares(
+            float_instance, float_profile, cardinal_utility, budget=float(budget)
+        )
+        exact_selected, float_selected = list(exact_selected), list(float_selected)
+        assert [p.name for p in exact_selected] == [p.name for p in float_selected]
+
+        exact_matrix = build_payments_matrix(exact_profile, exact_selected, exact_payments)
+        float_matrix = build_payments_matrix(float_profile, float_selected, float_payments)
+        for exact_project, float_project in zip(exact_instance.project_meta, float_instance.project_meta):
+            exact_d = greedy_project_change_approvals(
+                exact_instance, exact_profile, exact_selected, exact_matrix, exact_project
+            )
+            float_d = greedy_project_change_approvals(
+                float_instance, float_profile, float_selected, float_matrix, float_project
+            )
+            assert exact_d == float_d
+
+
+class TestEESAndAddOptPaths:
+    """exact_method_of_equal_shares and add_opt_approval on both paths."""
+
+    @pytest.mark.parametrize("utility_function", [cardinal_utility, cost_utility])
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_float_and_mpq_agree(self, seed, utility_function):
+        exact_instance, exact_profile, budget = random_election(random.Random(seed), exact=True)
+        float_instance, float_profile, _ = random_election(random.Random(seed), exact=False)
+
+        exact_funded, exact_payments, exact_shares, exact_total = exact_method_of_equal_shares(
+            exact_instance, exact_profile, utility_function
+        )
+        float_funded, float_payments, float_shares, float_total = exact_method_of_equal_shares(
+            float_instance, float_profile, utility_function, budget=float(budget)
+        )
+
+        assert [p.name for p in exact_funded] == [p.name for p in float_funded]
+        assert [float(v) for v in exact_funded.values()] == list(float_funded.values())
+        assert exact_total == float_total
+        assert {(v, p.name): amount for (v, p), amount in exact_payments.items()} == {
+            (v, p.name): amount for (v, p), amount in float_payments.items()
+        }
+        assert dict(exact_shares) == dict(float_shares)
+
+        if utility_function is cardinal_utility:
+            exact_d = add_opt_approval(
+                exact_instance, exact_profile, list(exact_funded), exact_payments, exact_shares
+            )
+            float_d = add_opt_approval(
+                float_instance, float_profile, list(float_funded), float_payments, float_shares,
+                budget=float(budget),
+            )
+            assert exact_d == float_d
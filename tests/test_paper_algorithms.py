@@ -633,6 +633,35 @@ class TestGPCUniform:
                 # Should be either None or a positive fraction
                 assert d is None or d >= 0
 
+    def test_gpc_uniform_skips_unreached_L_lists(self):
+        """L_i is only read for the indices i the scan reaches."""
+        e = make_election(
+            project_costs={"a": 10, "b": 10, "Z": 40},
+            approvals={
+                0: ["a", "Z"],
+                1: ["a"],
+                2: ["b"],
+                3: ["b", "Z"],
+            },
+            budget=40,
+        )
+
+        outcome = ees_with_outcome(e, cost_utility)
+        L_lists = compute_L_lists(e, outcome, cost_utility)
+        assert [p for p, _ in outcome.selection_order] == ["b", "a"]
+
+        class Unreachable(list):
+            def __iter__(self):
+                raise AssertionError("unreached L list was read")
+            __reversed__ = __iter__
+
+        # BpB(Z) with both supporters ties with a and b, but "Z" loses the
+        # tie-break, so the scan never leaves L_{w+1}
+        w = len(outcome.selection_order)
+        lazy_L_lists = [Unreachable(L_i) for L_i in L_lists[:w]] + [L_lists[w]]
+        d = greedy_project_change_uniform(e, outcome, "Z", cost_utility, lazy_L_lists)
+        assert d == Fraction(15)
+
 
 class TestAddOptUniformCriticalValue:
     """Test ADD-OPT for uniform utilities (Algorithm 5)."""